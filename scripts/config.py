@@ -3,38 +3,132 @@
 Configuration for The-Mind Repository Automation Scripts
 """
 import os
-import yaml
-from dotenv import load_dotenv
+import sys
+import pickle
+import functools
+from dataclasses import dataclass, field, fields
+from typing import Optional
 
 # --- Foundational Paths ---
 # Establish the root directory first, as other paths depend on it.
 ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 # --- Load Environment Variables ---
-# This will load the .env file in the root directory
-load_dotenv(dotenv_path=os.path.join(ROOT_DIR, '.env'))
+# The .env file in the root directory is loaded lazily by _ensure_env().
+DOTENV_PATH = os.path.join(ROOT_DIR, '.env')
+
+
+def _ensure_env():
+    """Loads the .env file into os.environ, skipping python-dotenv entirely when there is none."""
+    if not os.path.exists(DOTENV_PATH):
+        return
+    from dotenv import load_dotenv
+    load_dotenv(dotenv_path=DOTENV_PATH)
 
 # --- Load YAML Configuration ---
 # Load the static configuration from the YAML file.
 CONFIG_YAML_PATH = os.path.join(ROOT_DIR, 'config.yaml')
-with open(CONFIG_YAML_PATH, 'r') as f:
-    cfg = yaml.safe_load(f)
+CONFIG_CACHE_PATH = CONFIG_YAML_PATH + '.pkl'
+
+
+@functools.lru_cache(maxsize=1)
+def _load_cfg():
+    """
+    Loads config.yaml, reusing a pickled copy of the parsed dict when the YAML
+    file has not been modified since the pickle was written.
+    """
+    mtime_ns = os.stat(CONFIG_YAML_PATH).st_mtime_ns
+    try:
+        with open(CONFIG_CACHE_PATH, 'rb') as f:
+            cached_mtime_ns, cached_cfg = pickle.load(f)
+        if cached_mtime_ns == mtime_ns:
+            return cached_cfg
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+        pass  # Missing or unreadable cache, fall back to parsing the YAML
+
+    import yaml  # Deferred so a warm cache never pays the PyYAML import cost
+    with open(CONFIG_YAML_PATH, 'r') as f:
+        parsed_cfg = yaml.safe_load(f)
+
+    # Write to a temporary file first so a concurrent run never sees a partial pickle
+    tmp_path = f"{CONFIG_CACHE_PATH}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((mtime_ns, parsed_cfg), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, CONFIG_CACHE_PATH)
+    except OSError:
+        # The cache is an optimisation only; a read-only checkout still works
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+    return parsed_cfg
+
+
+cfg = _load_cfg()
+
+
+# --- Environment Snapshot ---
+def _env(name):
+    """Declares a config field that is populated from the named environment variable."""
+    return field(default=None, metadata={'env': name})
+
+
+@dataclass(frozen=True)
+class _Cfg:
+    """Immutable snapshot of every setting read from the environment."""
+    email_id: Optional[str] = _env("EMAIL_ID")
+    cf_handle: Optional[str] = _env("CODEFORCES_ID")
+    leetcode_username: Optional[str] = _env("LEETCODE_ID")
+    chesscom_id: Optional[str] = _env("CHESSCOM_ID")
+    steam_id: Optional[str] = _env("STEAM_ID")
+    youtube_channel_id: Optional[str] = _env("YOUTUBE_CHANNEL_ID")
+    github_id: Optional[str] = _env("GITHUB_ID")
+    cf_api_key: Optional[str] = _env("CODEFORCES_API_KEY")
+    cf_api_secret: Optional[str] = _env("CODEFORCES_API_SECRET")
+    steam_api_key: Optional[str] = _env("STEAM_API_KEY")
+    google_doc_id: Optional[str] = _env("GOOGLE_DOC_ID")
+    google_doc_codeforces_id: Optional[str] = _env("GOOGLE_DOC_CODEFORCES_ID")
+    google_doc_leetcode_id: Optional[str] = _env("GOOGLE_DOC_LEETCODE_ID")
+    google_doc_steam_id: Optional[str] = _env("GOOGLE_DOC_STEAM_ID")
+    google_doc_youtube_id: Optional[str] = _env("GOOGLE_DOC_YOUTUBE_ID")
+    google_doc_chesscom_id: Optional[str] = _env("GOOGLE_DOC_CHESSCOM_ID")
+    google_project_id: Optional[str] = _env("GOOGLE_PROJECT_ID")
+    google_auth_uri: Optional[str] = _env("GOOGLE_AUTH_URI")
+    google_token_uri: Optional[str] = _env("GOOGLE_TOKEN_URI")
+    google_auth_provider_x509_cert_url: Optional[str] = _env("GOOGLE_AUTH_PROVIDER_X509_CERT_URL")
+    google_client_id: Optional[str] = _env("GOOGLE_CLIENT_ID")
+    google_client_secret: Optional[str] = _env("GOOGLE_CLIENT_SECRET")
+    google_redirect_uris: Optional[str] = _env("GOOGLE_REDIRECT_URIS")
+
+    @classmethod
+    def from_env(cls):
+        """Loads the .env file, then populates every field from a single environment snapshot."""
+        _ensure_env()
+        env = os.environ.copy()
+        return cls(**{f.name: env.get(f.metadata['env']) for f in fields(cls)})
+
+
+CFG = _Cfg.from_env()
 
 # --- User IDs ---
-EMAIL_ID = os.environ.get("EMAIL_ID")
-CF_HANDLE = os.environ.get("CODEFORCES_ID")
-LEETCODE_USERNAME = os.environ.get("LEETCODE_ID")
-CHESSCOM_ID = os.environ.get("CHESSCOM_ID")
-STEAM_ID = os.environ.get("STEAM_ID")
-YOUTUBE_CHANNEL_ID = os.environ.get("YOUTUBE_CHANNEL_ID")
-GITHUB_ID = os.environ.get("GITHUB_ID")
+EMAIL_ID = CFG.email_id
+CF_HANDLE = CFG.cf_handle
+LEETCODE_USERNAME = CFG.leetcode_username
+CHESSCOM_ID = CFG.chesscom_id
+STEAM_ID = CFG.steam_id
+YOUTUBE_CHANNEL_ID = CFG.youtube_channel_id
+GITHUB_ID = CFG.github_id
 
 # --- General Paths (constructed from YAML) ---
-TEMP_DIR = os.path.join(ROOT_DIR, cfg['paths']['temp'])
+# Every entry under 'paths' is resolved against the project root in a single pass.
+_PATHS = {name: os.path.join(ROOT_DIR, relative_path) for name, relative_path in cfg['paths'].items()}
+TEMP_DIR = _PATHS['temp']
+CACHE_DIR = _PATHS['cache']
 
 # --- Codeforces ---
-CF_API_KEY = os.environ.get("CODEFORCES_API_KEY")
-CF_API_SECRET = os.environ.get("CODEFORCES_API_SECRET")
+CF_API_KEY = CFG.cf_api_key
+CF_API_SECRET = CFG.cf_api_secret
 
 
 # --- LeetCode ---
@@ -47,7 +141,7 @@ CHESSCOM_API_ENDPOINT = cfg['api_endpoints']['chesscom']
 
 
 # --- Steam ---
-STEAM_API_KEY = os.environ.get("STEAM_API_KEY")
+STEAM_API_KEY = CFG.steam_api_key
 STEAM_API_ENDPOINT = cfg['api_endpoints']['steam']
 
 
@@ -56,25 +150,29 @@ STEAM_API_ENDPOINT = cfg['api_endpoints']['steam']
 
 # --- Cloud Sync ---
 SCOPES = cfg['cloud']['google_scopes']
-TOKEN_FILE = os.path.join(ROOT_DIR, cfg['paths']['token_file'])
-GOOGLE_DOC_ID = os.environ.get("GOOGLE_DOC_ID")
-GOOGLE_DOC_CODEFORCES_ID = os.environ.get("GOOGLE_DOC_CODEFORCES_ID")
-GOOGLE_DOC_LEETCODE_ID = os.environ.get("GOOGLE_DOC_LEETCODE_ID")
-GOOGLE_DOC_STEAM_ID = os.environ.get("GOOGLE_DOC_STEAM_ID")
-GOOGLE_DOC_YOUTUBE_ID = os.environ.get("GOOGLE_DOC_YOUTUBE_ID")
-GOOGLE_DOC_CHESSCOM_ID = os.environ.get("GOOGLE_DOC_CHESSCOM_ID")
+TOKEN_FILE = _PATHS['token_file']
+GOOGLE_DOC_ID = CFG.google_doc_id
+GOOGLE_DOC_CODEFORCES_ID = CFG.google_doc_codeforces_id
+GOOGLE_DOC_LEETCODE_ID = CFG.google_doc_leetcode_id
+GOOGLE_DOC_STEAM_ID = CFG.google_doc_steam_id
+GOOGLE_DOC_YOUTUBE_ID = CFG.google_doc_youtube_id
+GOOGLE_DOC_CHESSCOM_ID = CFG.google_doc_chesscom_id
+GOOGLE_DOC_SYNC_STATE_FILE = os.path.join(TEMP_DIR, cfg['cloud']['doc_sync_state_file'])
+GOOGLE_DOC_LAST_CONTENT_DIR = os.path.join(TEMP_DIR, cfg['cloud']['doc_last_content_dir'])
 
 # --- Google OAuth (from .env) ---
-GOOGLE_AUTH_URL_FILE = os.path.join(TEMP_DIR, cfg['auth']['url_file'])
-GOOGLE_AUTH_CODE_FILE = os.path.join(TEMP_DIR, cfg['auth']['code_file'])
+_AUTH_FILES = {name: os.path.join(TEMP_DIR, file_name) for name, file_name in cfg['auth'].items()}
+GOOGLE_AUTH_URL_FILE = _AUTH_FILES['url_file']
+GOOGLE_AUTH_CODE_FILE = _AUTH_FILES['code_file']
+GOOGLE_TOKEN_CACHE_FILE = _AUTH_FILES['token_cache_file']
 GOOGLE_SERVICE_ACCOUNT_KEY_PATH = os.path.join(ROOT_DIR, "Temp", "service_account_key.json")
-GOOGLE_PROJECT_ID = os.environ.get("GOOGLE_PROJECT_ID")
-GOOGLE_AUTH_URI = os.environ.get("GOOGLE_AUTH_URI")
-GOOGLE_TOKEN_URI = os.environ.get("GOOGLE_TOKEN_URI")
-GOOGLE_AUTH_PROVIDER_X509_CERT_URL = os.environ.get("GOOGLE_AUTH_PROVIDER_X509_CERT_URL")
-GOOGLE_CLIENT_ID = os.environ.get("GOOGLE_CLIENT_ID")
-GOOGLE_CLIENT_SECRET = os.environ.get("GOOGLE_CLIENT_SECRET")
-GOOGLE_REDIRECT_URIS = os.environ.get("GOOGLE_REDIRECT_URIS")
+GOOGLE_PROJECT_ID = CFG.google_project_id
+GOOGLE_AUTH_URI = CFG.google_auth_uri
+GOOGLE_TOKEN_URI = CFG.google_token_uri
+GOOGLE_AUTH_PROVIDER_X509_CERT_URL = CFG.google_auth_provider_x509_cert_url
+GOOGLE_CLIENT_ID = CFG.google_client_id
+GOOGLE_CLIENT_SECRET = CFG.google_client_secret
+GOOGLE_REDIRECT_URIS = CFG.google_redirect_uris
 
 
 
@@ -85,15 +183,15 @@ CODING_DIR = os.path.dirname(ROOT_DIR)
 
 # --- File Operations ---
 
+# Windows consoles often default to a legacy code page; switch stdout to UTF-8 once here
+# instead of guarding every print against UnicodeEncodeError.
+if sys.stdout is not None and (sys.stdout.encoding or '').lower() not in ('utf-8', 'utf8') \
+        and hasattr(sys.stdout, 'reconfigure'):
+    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+
 
 def print_section_header(title):
     """Prints a formatted section header."""
-    try:
-        print("\n" + "="*20)
-        print(f" {title.upper()} ")
-        print("="*20)
-    except UnicodeEncodeError:
-        # Fallback for Windows console encoding issues
-        print("\n" + "="*20)
-        print(f" {title.upper()} ")
-        print("="*20)
+    print("\n" + "="*20)
+    print(f" {title.upper()} ")
+    print("="*20)
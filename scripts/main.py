@@ -4,14 +4,43 @@ Main entry point for The-Mind Repository Automation Workflow.
 """
 import sys
 import os
+import types
+import functools
+import importlib
+import logging
 
-# Ensure the script can find the modules directory
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Ensure the script can find the modules directory. This bootstrap has to compute the
+# project root itself, since scripts.config (which owns ROOT_DIR) is not importable yet.
+_BOOTSTRAP_ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _BOOTSTRAP_ROOT_DIR not in sys.path:
+    sys.path.append(_BOOTSTRAP_ROOT_DIR)
 
-from scripts.modules.validation import Validator
-from scripts.modules.profile_generator import CodeforcesGenerator, LeetCodeGenerator, SteamStatsGenerator, YouTubeGenerator, ChessComGenerator
-from scripts.modules.cloud_sync import CloudSyncer
-from scripts.config import GOOGLE_DOC_CODEFORCES_ID, GOOGLE_DOC_LEETCODE_ID, GOOGLE_DOC_STEAM_ID, GOOGLE_DOC_YOUTUBE_ID, GOOGLE_DOC_CHESSCOM_ID
+
+@functools.lru_cache(maxsize=None)
+def _load_class(module_path, class_name):
+    """Imports the module on first use and returns the named class from it."""
+    return getattr(importlib.import_module(module_path), class_name)
+
+
+def _generate_and_sync(generator_class_name, sync_method_name):
+    """Generates a profile and, if any content was produced, syncs it with the given CloudSyncer method."""
+    generator_class = _load_class('scripts.modules.profile_generator', generator_class_name)
+    profile_content = generator_class().generate()
+    if profile_content:
+        cloud_syncer = _load_class('scripts.modules.cloud_sync', 'CloudSyncer')()
+        return getattr(cloud_syncer, sync_method_name)(profile_content)
+    return False
+
+
+# Built once per process. Each entry is a deferred call, so only the selected
+# workflow's modules are ever imported and instantiated.
+_WORKFLOWS = types.MappingProxyType({
+    'chess-com': functools.partial(_generate_and_sync, 'ChessComGenerator', 'sync_chesscom_to_gdoc'),
+    'codeforces': functools.partial(_generate_and_sync, 'CodeforcesGenerator', 'sync_codeforces_to_gdoc'),
+    'leetcode': functools.partial(_generate_and_sync, 'LeetCodeGenerator', 'sync_leetcode_to_gdoc'),
+    'steam-stats': functools.partial(_generate_and_sync, 'SteamStatsGenerator', 'sync_steam_to_gdoc'),
+    'youtube': functools.partial(_generate_and_sync, 'YouTubeGenerator', 'sync_youtube_to_gdoc'),
+})
 
 
 def main():
@@ -20,27 +49,15 @@ def main():
         print("Usage: python main.py [workflow]")
         sys.exit(1)
 
+    # Same stream as the print-based output so messages stay in order
+    logging.basicConfig(handlers=[logging.StreamHandler(sys.stdout)], level=logging.INFO,
+                        format="%(asctime)s %(levelname)s %(message)s")
+
     workflow = sys.argv[1]
     success = False
 
-    cloud_syncer = CloudSyncer()
-
-    def _generate_and_sync(generator_class, sync_method, doc_id):
-        profile_content = generator_class().generate()
-        if profile_content:
-            return sync_method(profile_content)
-        return False
-
-    workflows = {
-        'chess-com': lambda: _generate_and_sync(ChessComGenerator, cloud_syncer.sync_chesscom_to_gdoc, GOOGLE_DOC_CHESSCOM_ID),
-        'codeforces': lambda: _generate_and_sync(CodeforcesGenerator, cloud_syncer.sync_codeforces_to_gdoc, GOOGLE_DOC_CODEFORCES_ID),
-        'leetcode': lambda: _generate_and_sync(LeetCodeGenerator, cloud_syncer.sync_leetcode_to_gdoc, GOOGLE_DOC_LEETCODE_ID),
-        'steam-stats': lambda: _generate_and_sync(SteamStatsGenerator, cloud_syncer.sync_steam_to_gdoc, GOOGLE_DOC_STEAM_ID),
-        'youtube': lambda: _generate_and_sync(YouTubeGenerator, cloud_syncer.sync_youtube_to_gdoc, GOOGLE_DOC_YOUTUBE_ID),
-    }
-
-    if workflow in workflows:
-        success = workflows[workflow]()
+    if workflow in _WORKFLOWS:
+        success = _WORKFLOWS[workflow]()
     else:
         print(f"[ERROR] Unknown workflow: {workflow}")
         sys.exit(1)
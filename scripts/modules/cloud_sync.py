@@ -3,161 +3,574 @@
 Handles cloud synchronization tasks for The-Automaton repository, including syncing
 to local directories and Google Drive.
 """
-import time
+import os
+import re
+import json
+import logging
+import hashlib
+import mmap
+import threading
+import functools
+from functools import cached_property
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from scripts.config import (
     GOOGLE_DOC_CODEFORCES_ID, GOOGLE_DOC_LEETCODE_ID, GOOGLE_DOC_STEAM_ID,
-    GOOGLE_DOC_YOUTUBE_ID, GOOGLE_DOC_CHESSCOM_ID,
-    print_section_header
+    GOOGLE_DOC_YOUTUBE_ID, GOOGLE_DOC_CHESSCOM_ID, GOOGLE_DOC_SYNC_STATE_FILE,
+    GOOGLE_DOC_LAST_CONTENT_DIR
 )
-from scripts.modules.google_auth import GoogleAuthenticator, GOOGLE_LIBS_AVAILABLE
 
-if GOOGLE_LIBS_AVAILABLE:
+logger = logging.getLogger("automaton.cloud_sync")
+
+# Sidecar written next to a source file to record the state it was last synced in
+SYNC_MARKER_SUFFIX = '.synced'
+
+# Upper bound on Google Doc syncs in flight at once
+MAX_CONCURRENT_DOC_SYNCS = 5
+# Retries for rate-limit and 5xx responses, with randomized exponential backoff done by googleapiclient
+API_NUM_RETRIES = 5
+
+# Characters Docs drops from inserted text: C0 controls other than tab, newline and vertical tab
+# (so \r too), and the Private Use Area
+_DOCS_STRIPPED_CHARS = re.compile('[\x00-\x08\x0c-\x1f\ue000-\uf8ff]')
+
+# Recently read files keyed by path, stored with the (mtime_ns, size) they were read at
+_TEXT_FILE_CACHE = {}
+
+
+def _read_text_file(f, path, stat):
+    """
+    Memory-maps an open binary file and returns (text, sha256 hexdigest). The digest is taken
+    over the raw bytes and only the API copy is decoded as UTF-8. Cached results are reused
+    while the file's (mtime_ns, size) is unchanged, and empty files are not read at all.
+    """
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _TEXT_FILE_CACHE.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    if stat.st_size:
+        # Map the file instead of reading it into an intermediate bytes object; the hash and
+        # the decode both work straight off the page cache.
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            digest = hashlib.sha256(mm).hexdigest()
+            text = str(mm, 'utf-8')
+    else:
+        text, digest = '', hashlib.sha256(b'').hexdigest()
+    if '\r' in text:
+        # Match the newline translation that text-mode reads used to apply
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    result = (text, digest)
+    _TEXT_FILE_CACHE[path] = (signature, result)
+    return result
+
+
+def _normalize_doc_text(text):
+    """
+    Returns text as Docs stores it once inserted. Hashes, diffs and the saved last-content copy
+    are all taken over this form so their UTF-16 offsets match the live document.
+    """
+    return _DOCS_STRIPPED_CHARS.sub('', text)
+
+
+def _doc_end_index(text):
+    """
+    Returns the body endIndex a document has after its body is replaced with text.
+    Docs indexes count UTF-16 code units, the body starts at index 1 and always ends
+    with a trailing newline. Characters Docs strips on insert take up no index.
+    """
+    return _utf16_len(_normalize_doc_text(text)) + 2
+
+
+@functools.lru_cache(maxsize=None)
+def _http_error():
+    """
+    Returns googleapiclient's HttpError. The Google client libraries are only imported once a
+    sync actually talks to Google, which can only happen after they imported successfully.
+    """
     from googleapiclient.errors import HttpError
+    return HttpError
+
+
+def _utf16_len(text):
+    """Returns the length of text in UTF-16 code units, the unit Docs indexes are counted in."""
+    return len(text.encode('utf-16-le')) // 2
+
+
+def _changed_range(old, new):
+    """
+    Returns (prefix, old_end, new_end) such that old[prefix:old_end] is the only part of old
+    that has to be replaced by new[prefix:new_end] to turn it into new.
+    """
+    prefix = len(os.path.commonprefix((old, new)))
+    max_suffix = min(len(old), len(new)) - prefix
+    suffix = len(os.path.commonprefix((old[::-1], new[::-1])))
+    suffix = min(suffix, max_suffix)
+    return prefix, len(old) - suffix, len(new) - suffix
+
+
+def _content_hash(text):
+    """Returns a short fingerprint of text, used to detect documents that already hold it."""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _write_json_atomic(path, data):
+    """Writes data as JSON via a temporary file so readers never see a partial file."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+
+def _read_sync_marker(source_path):
+    """Returns the {mtime_ns, size, sha256} recorded at the file's last successful sync, if any."""
+    try:
+        with open(source_path + SYNC_MARKER_SUFFIX, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_sync_marker(source_path, marker):
+    """Records the file's signature after a successful sync. Failure to write it is not fatal."""
+    try:
+        _write_json_atomic(source_path + SYNC_MARKER_SUFFIX, marker)
+    except OSError as e:
+        logger.warning("Could not record sync state for %s: %s", source_path, e)
+
 
 class CloudSyncer:
     """A class to handle cloud synchronization."""
 
     def __init__(self):
+        self._thread_local = threading.local()
+        self._doc_state = None
+        self._doc_state_lock = threading.Lock()
+
+    @cached_property
+    def authenticator(self):
+        """The Google authenticator, created on first use so runs that never reach Google skip authentication."""
         try:
-            self.authenticator = GoogleAuthenticator()
+            from scripts.modules.google_auth import get_authenticator
+            return get_authenticator()
         except ImportError:
-            self.authenticator = None
+            return None
+
+    def _get_docs_service(self):
+        """Returns the Google Docs service (cached by the authenticator)."""
+        return self.authenticator.get_service("docs", "v1")
+
+    def _get_http(self):
+        """Returns the authorized HTTP client owned by the calling thread."""
+        http = getattr(self._thread_local, 'http', None)
+        if http is None:
+            http = self._thread_local.http = self.authenticator.authorized_http()
+        return http
+
+    def _get_doc_state(self, doc_id):
+        """Returns the {end_index, revision_id} recorded after this tool last wrote the document, if any."""
+        with self._doc_state_lock:
+            if self._doc_state is None:
+                try:
+                    with open(GOOGLE_DOC_SYNC_STATE_FILE, 'r', encoding='utf-8') as f:
+                        self._doc_state = json.load(f)
+                except (OSError, ValueError):
+                    self._doc_state = {}
+            return self._doc_state.get(doc_id)
+
+    def _record_doc_state(self, doc_id, end_index, revision_id, content_hash):
+        """Persists the document's end index, revision and content hash after a successful write."""
+        with self._doc_state_lock:
+            if self._doc_state is None:
+                self._doc_state = {}
+            if revision_id:
+                self._doc_state[doc_id] = {"end_index": end_index, "revision_id": revision_id,
+                                           "content_hash": content_hash}
+            else:
+                self._doc_state.pop(doc_id, None)
+            try:
+                _write_json_atomic(GOOGLE_DOC_SYNC_STATE_FILE, self._doc_state)
+            except OSError as e:
+                logger.warning("Could not save Google Doc sync state: %s", e)
+
+    def _build_replace_requests(self, content_string, end_of_doc_index):
+        """Builds the requests that replace a body ending at end_of_doc_index with the given content."""
+        # The delete and insert are sent together in one batchUpdate, so replacing the body
+        # costs a single write call. The delete comes first so the insert index stays valid.
+        requests = []
+        if end_of_doc_index > 2:
+            requests.append({
+                "deleteContentRange": {
+                    "range": {
+                        "startIndex": 1,
+                        "endIndex": end_of_doc_index - 1
+                    }
+                }
+            })
+
+        if content_string:
+            requests.append({
+                "insertText": {
+                    "location": {"index": 1},
+                    "text": content_string
+                }
+            })
+        return requests
+
+    def _build_diff_requests(self, old_content, content_string):
+        """
+        Builds the requests that turn a body holding old_content into one holding content_string,
+        touching only the range between their common prefix and common suffix.
+        """
+        prefix, old_end, new_end = _changed_range(old_content, content_string)
+        start_index = 1 + _utf16_len(old_content[:prefix])
+        requests = []
+        if old_end > prefix:
+            requests.append({
+                "deleteContentRange": {
+                    "range": {
+                        "startIndex": start_index,
+                        "endIndex": start_index + _utf16_len(old_content[prefix:old_end])
+                    }
+                }
+            })
+        if new_end > prefix:
+            requests.append({
+                "insertText": {
+                    "location": {"index": start_index},
+                    "text": content_string[prefix:new_end]
+                }
+            })
+        return requests
+
+    def _last_content_path(self, doc_id):
+        return os.path.join(GOOGLE_DOC_LAST_CONTENT_DIR, f"{doc_id}.txt")
+
+    def _read_last_content(self, doc_id, state):
+        """Returns the content this tool last wrote to the document, if a copy matching the recorded state exists."""
+        try:
+            with open(self._last_content_path(doc_id), 'r', encoding='utf-8', newline='') as f:
+                content = f.read()
+        except (OSError, ValueError):
+            return None
+        return content if _content_hash(content) == state.get('content_hash') else None
+
+    def _write_last_content(self, doc_id, content_string):
+        """Keeps a copy of the content written to the document for the next diff."""
+        path = self._last_content_path(doc_id)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(GOOGLE_DOC_LAST_CONTENT_DIR, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+                f.write(content_string)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("Could not save last synced content for %s: %s", doc_id, e)
+
+    def _prepare_requests(self, docs_service, content_string, doc_id):
+        """Reads the document's current end index and builds the requests that replace its body."""
+        document = docs_service.documents().get(documentId=doc_id, fields="body(content(endIndex))").execute(http=self._get_http(), num_retries=API_NUM_RETRIES)
+        content = document.get('body', {}).get('content', [])
+        end_of_doc_index = content[-1].get('endIndex', 0) if content else 0
+        return self._build_replace_requests(content_string, end_of_doc_index)
+
+    def _execute_requests(self, docs_service, doc_id, requests, required_revision_id=None):
+        """
+        Applies the prepared requests to the document in a single batchUpdate and returns the
+        document's new revision ID. With required_revision_id set, the update is rejected if
+        the document has changed since that revision.
+        """
+        if not requests:
+            return required_revision_id
+        body = {"requests": requests}
+        if required_revision_id:
+            body["writeControl"] = {"requiredRevisionId": required_revision_id}
+        response = docs_service.documents().batchUpdate(documentId=doc_id, body=body).execute(http=self._get_http(), num_retries=API_NUM_RETRIES)
+        return response.get('writeControl', {}).get('requiredRevisionId')
+
+    def _plan_fast_write(self, doc_id, content_string, state):
+        """
+        Builds the requests for a write that relies on the recorded state instead of reading the
+        document: only the changed range if a copy of the previous content is kept, otherwise a
+        full replace up to the recorded end index.
+        """
+        old_content = self._read_last_content(doc_id, state)
+        if old_content is not None:
+            return self._build_diff_requests(old_content, content_string)
+        return self._build_replace_requests(content_string, state['end_index'])
+
+    def _finish_write(self, doc_id, content_string, revision_id, content_hash):
+        """Records what was written so the next sync can skip or shrink its write."""
+        if revision_id:
+            self._write_last_content(doc_id, content_string)
+        self._record_doc_state(doc_id, _doc_end_index(content_string), revision_id, content_hash)
+
+    def _replace_doc_content(self, docs_service, content_string, doc_id, content_hash):
+        """
+        Replaces the document's body with the given content. When this tool wrote the document
+        last, the read round-trip is skipped (see _plan_fast_write). That write is pinned to the
+        recorded revision, so a document edited elsewhere is re-read and fully replaced instead.
+        """
+        state = self._get_doc_state(doc_id)
+        revision_id = None
+        if state:
+            try:
+                requests = self._plan_fast_write(doc_id, content_string, state)
+                revision_id = self._execute_requests(docs_service, doc_id, requests, state['revision_id'])
+            except _http_error() as err:
+                if err.resp.status != 400:
+                    raise
+                logger.info("Google Doc changed since the last sync. Re-reading it before writing.")
+                state = None
+
+        if not state:
+            requests = self._prepare_requests(docs_service, content_string, doc_id)
+            revision_id = self._execute_requests(docs_service, doc_id, requests)
 
+        self._finish_write(doc_id, content_string, revision_id, content_hash)
 
-    def _sync_any_content_to_gdoc(self, content_string, doc_id, doc_id_source_name="provided", max_retries=5, initial_delay=1):
+    def _batch_write_profiles(self, docs_service, pending):
+        """
+        Sends the fast-path writes of several documents as one batch HTTP request.
+        pending maps profile_type -> (doc_id, content, content_hash, state).
+        Returns the profile types that were written; the rest are left for the regular sync path.
+        """
+        written = set()
+
+        def _on_response(profile_type, response, exception):
+            if exception is not None:
+                logger.info("Batched write for %s failed (%s). Retrying it on its own.", profile_type, exception)
+                return
+            doc_id, content_string, content_hash, _ = pending[profile_type]
+            revision_id = response.get('writeControl', {}).get('requiredRevisionId')
+            self._finish_write(doc_id, content_string, revision_id, content_hash)
+            written.add(profile_type)
+
+        batch = docs_service.new_batch_http_request(callback=_on_response)
+        for profile_type, (doc_id, content_string, content_hash, state) in pending.items():
+            body = {
+                "requests": self._plan_fast_write(doc_id, content_string, state),
+                "writeControl": {"requiredRevisionId": state['revision_id']},
+            }
+            batch.add(docs_service.documents().batchUpdate(documentId=doc_id, body=body), request_id=profile_type)
+        try:
+            batch.execute(http=self._get_http())
+        except Exception as e:
+            logger.warning("Batched Google Doc write failed: %s", e)
+        for profile_type in written:
+            logger.info("Successfully synced %s to its Google Doc in a batch.", profile_type)
+        return written
+
+    def _sync_any_content_to_gdoc(self, content_string, doc_id, doc_id_source_name="provided"):
         """
         Generic function to sync a string content to a specific Google Doc.
         This function will completely overwrite the document's content.
-        Includes retry logic with exponential backoff.
+        Transient API errors are retried by the client library (see API_NUM_RETRIES).
         """
-        if not self.authenticator:
-            print("ERROR: Google Authenticator not available.")
-            return False
         if not doc_id:
-            print(f"CRITICAL ERROR: Google Doc ID from {doc_id_source_name} not found. Skipping sync.")
+            logger.critical("Google Doc ID from %s not found. Skipping sync.", doc_id_source_name)
             return False
 
-        for attempt in range(max_retries):
-            try:
-                docs_service = self.authenticator.get_service("docs", "v1")
-                if not docs_service:
-                    return False
-                
-                file_content = content_string
-
-                if not file_content:
-                    print(f"WARNING: Source content is empty. Clearing Google Doc.")
-                
-                document = docs_service.documents().get(documentId=doc_id, fields="body(content)").execute()
-                content = document.get('body', {}).get('content', [])
-                
-                requests = []
-                if content:
-                    end_of_doc_index = content[-1].get('endIndex', 0)
-                    if end_of_doc_index > 2:
-                        requests.append({
-                            "deleteContentRange": {
-                                "range": {
-                                    "startIndex": 1,
-                                    "endIndex": end_of_doc_index - 1
-                                }
-                            }
-                        })
-
-                if file_content:
-                    requests.append({
-                        "insertText": {
-                            "location": {"index": 1},
-                            "text": file_content
-                        }
-                    })
-
-                if requests:
-                    docs_service.documents().batchUpdate(documentId=doc_id, body={"requests": requests}).execute()
-                
-                print(f"Successfully synced content to Google Doc.")
-                return True
-            except HttpError as err:
-                if err.resp.status in [403, 429, 500, 503] and attempt < max_retries - 1:
-                    delay = initial_delay * (2 ** attempt)
-                    print(f"Google API error (status {err.resp.status}). Retrying in {delay} seconds...")
-                    time.sleep(delay)
-                else:
-                    print(f"A Google API error occurred after {attempt + 1} attempts: {err}")
-                    return False
-            except Exception as e:
-                print(f"An unexpected error occurred during Google Doc sync after {attempt + 1} attempts: {e}")
+        content_string = _normalize_doc_text(content_string or "")
+        content_hash = _content_hash(content_string)
+        state = self._get_doc_state(doc_id)
+        if state and state.get('content_hash') == content_hash:
+            logger.info("Google Doc %s already has this content. Skipping sync.", doc_id_source_name)
+            return True
+
+        if not self.authenticator:
+            logger.error("Google Authenticator not available.")
+            return False
+
+        try:
+            docs_service = self._get_docs_service()
+            if not docs_service:
                 return False
-        return False # All retries failed
+
+            if not content_string:
+                logger.warning("Source content is empty. Clearing Google Doc.")
+
+            self._replace_doc_content(docs_service, content_string, doc_id, content_hash)
+
+            logger.info("Successfully synced content to Google Doc %s.", doc_id_source_name)
+            return True
+        except _http_error() as err:
+            logger.error("A Google API error occurred (status %s): %s", err.resp.status, err)
+            return False
+        except Exception as e:
+            logger.error("An unexpected error occurred during Google Doc sync: %s", e)
+            return False
 
     def sync_codeforces_to_gdoc(self, content):
         """Syncs the Codeforces profile to its Google Doc."""
-        print_section_header("Sync Codeforces Profile to Google Doc")
+        logger.info("Sync Codeforces Profile to Google Doc")
         return self._sync_any_content_to_gdoc(content, GOOGLE_DOC_CODEFORCES_ID, "GOOGLE_DOC_CODEFORCES_ID")
 
     def sync_leetcode_to_gdoc(self, content):
         """Syncs the LeetCode profile to its Google Doc."""
-        print_section_header("Sync LeetCode Profile to Google Doc")
+        logger.info("Sync LeetCode Profile to Google Doc")
         return self._sync_any_content_to_gdoc(content, GOOGLE_DOC_LEETCODE_ID, "GOOGLE_DOC_LEETCODE_ID")
 
     def sync_steam_to_gdoc(self, content):
         """Syncs the Steam stats to its Google Doc."""
-        print_section_header("Sync Steam Stats to Google Doc")
+        logger.info("Sync Steam Stats to Google Doc")
         return self._sync_any_content_to_gdoc(content, GOOGLE_DOC_STEAM_ID, "GOOGLE_DOC_STEAM_ID")
 
     def sync_youtube_to_gdoc(self, content):
         """Syncs the YouTube stats to its Google Doc."""
-        print_section_header("Sync YouTube Stats to Google Doc")
+        logger.info("Sync YouTube Stats to Google Doc")
         return self._sync_any_content_to_gdoc(content, GOOGLE_DOC_YOUTUBE_ID, "GOOGLE_DOC_YOUTUBE_ID")
 
     def sync_chesscom_to_gdoc(self, content):
         """Syncs the Chess.com profile to its Google Doc."""
-        print_section_header("Sync Chess.com Profile to Google Doc")
+        logger.info("Sync Chess.com Profile to Google Doc")
         return self._sync_any_content_to_gdoc(content, GOOGLE_DOC_CHESSCOM_ID, "GOOGLE_DOC_CHESSCOM_ID")
 
-    def sync_all_profiles_to_gdocs(self, profiles_content):
-        """Syncs all supported shared files to their respective Google Docs."""
-        print_section_header("Sync All Shared Files to Google Docs")
-        sync_map = {
-            "codeforces": (self.sync_codeforces_to_gdoc, GOOGLE_DOC_CODEFORCES_ID),
-            "leetcode": (self.sync_leetcode_to_gdoc, GOOGLE_DOC_LEETCODE_ID),
-            "steam": (self.sync_steam_to_gdoc, GOOGLE_DOC_STEAM_ID),
-            "youtube": (self.sync_youtube_to_gdoc, GOOGLE_DOC_YOUTUBE_ID),
-            "chesscom": (self.sync_chesscom_to_gdoc, GOOGLE_DOC_CHESSCOM_ID)
+    def _profile_sync_funcs(self):
+        """Maps each supported profile type to the method that syncs it."""
+        return {
+            "codeforces": self.sync_codeforces_to_gdoc,
+            "leetcode": self.sync_leetcode_to_gdoc,
+            "steam": self.sync_steam_to_gdoc,
+            "youtube": self.sync_youtube_to_gdoc,
+            "chesscom": self.sync_chesscom_to_gdoc
         }
-        
-        all_successful = True
-        for profile_type, (sync_func, doc_id) in sync_map.items():
-            content = profiles_content.get(profile_type)
-            if content is None:
-                print(f"WARNING: No content provided for {profile_type}. Skipping sync.")
+
+    def _profile_doc_ids(self):
+        """Maps each supported profile type to the Google Doc it is synced to."""
+        return {
+            "codeforces": GOOGLE_DOC_CODEFORCES_ID,
+            "leetcode": GOOGLE_DOC_LEETCODE_ID,
+            "steam": GOOGLE_DOC_STEAM_ID,
+            "youtube": GOOGLE_DOC_YOUTUBE_ID,
+            "chesscom": GOOGLE_DOC_CHESSCOM_ID
+        }
+
+    def _sync_profiles(self, profiles_content):
+        """
+        Syncs the given profiles to their Google Docs concurrently.
+        Returns a dict mapping each profile type to whether its sync succeeded.
+        """
+        sync_funcs = self._profile_sync_funcs()
+        profile_types = [profile_type for profile_type in sync_funcs if profile_type in profiles_content]
+        if not profile_types:
+            return {}
+
+        # Documents this tool wrote last can be updated without reading them first, so their
+        # writes are bundled into one batch HTTP request. Anything not written there (new
+        # documents, edited documents, failures) goes through the regular per-profile sync.
+        doc_ids = self._profile_doc_ids()
+        results = {}
+        pending = {}
+        needs_write = False
+        for profile_type in profile_types:
+            content, doc_id = profiles_content[profile_type], doc_ids[profile_type]
+            if content is None or not doc_id:
+                continue
+            state = self._get_doc_state(doc_id)
+            content = _normalize_doc_text(content)
+            content_hash = _content_hash(content)
+            if state and state.get('content_hash') == content_hash:
                 continue
-            
+            needs_write = True
+            if state:
+                pending[profile_type] = (doc_id, content, content_hash, state)
+
+        # Authentication is only paid for when some document has to be written; when every profile is
+        # unchanged it is skipped entirely. Otherwise the authenticator and Docs service are resolved
+        # here, before any worker thread starts, so the threads never race to create them.
+        docs_service = None
+        if needs_write and self.authenticator:
+            docs_service = self._get_docs_service()
+        if docs_service and len(pending) > 1:
+            for profile_type in self._batch_write_profiles(docs_service, pending):
+                results[profile_type] = True
+            profile_types = [profile_type for profile_type in profile_types if profile_type not in results]
+
+        def _sync_profile(profile_type):
+            content = profiles_content[profile_type]
+            if content is None:
+                logger.warning("No content provided for %s. Skipping sync.", profile_type)
+                return True
+
             try:
-                if not sync_func(content):
-                    all_successful = False
-                    print(f"Sync failed for: {profile_type}")
+                if not sync_funcs[profile_type](content):
+                    logger.error("Sync failed for: %s", profile_type)
+                    return False
+                return True
             except Exception as e:
-                all_successful = False
-                print(f"An unexpected error occurred during sync for {profile_type}: {e}")
-        
-        return all_successful
+                logger.error("An unexpected error occurred during sync for %s: %s", profile_type, e)
+                return False
+
+        # Each sync is dominated by network round-trips, so run them concurrently. Worker count is
+        # capped to stay within the Docs API per-user request rate.
+        if not profile_types:
+            return results
+        with ThreadPoolExecutor(max_workers=min(len(profile_types), MAX_CONCURRENT_DOC_SYNCS)) as executor:
+            futures = {executor.submit(_sync_profile, profile_type): profile_type for profile_type in profile_types}
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        return results
+
+    def sync_all_profiles_to_gdocs(self, profiles_content):
+        """Syncs all supported shared files to their respective Google Docs."""
+        logger.info("Sync All Shared Files to Google Docs")
+        all_profiles = {profile_type: profiles_content.get(profile_type) for profile_type in self._profile_sync_funcs()}
+        return all(self._sync_profiles(all_profiles).values())
 
     def sync_all_profiles_to_gdocs_from_files(self, codeforces_file, leetcode_file, steam_file, youtube_file, chesscom_file):
         """
         Reads content from files and then syncs all supported profiles to their respective Google Docs.
+        Files that are unchanged since their last successful sync are skipped.
         """
+        logger.info("Sync All Shared Files to Google Docs")
+        profile_files = {
+            'codeforces': codeforces_file,
+            'leetcode': leetcode_file,
+            'steam': steam_file,
+            'youtube': youtube_file,
+            'chesscom': chesscom_file,
+        }
+
+        def _load_profile(profile_type, path):
+            """Returns (file_found, content, marker); content is None when the file needs no sync."""
+            try:
+                f = open(path, 'rb')
+            except FileNotFoundError:
+                logger.error("Profile file for %s not found: %s", profile_type, path)
+                return False, None, None
+
+            with f:
+                stat = os.fstat(f.fileno())
+                last_marker = _read_sync_marker(path)
+                if last_marker and last_marker.get('mtime_ns') == stat.st_mtime_ns and last_marker.get('size') == stat.st_size:
+                    logger.info("Skipping %s: %s is unchanged since the last sync.", profile_type, path)
+                    return True, None, None
+                content, digest = _read_text_file(f, path, stat)
+
+            marker = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'sha256': digest}
+            if last_marker and last_marker.get('sha256') == marker['sha256']:
+                # Touched but identical, so only the marker needs refreshing
+                _write_sync_marker(path, marker)
+                logger.info("Skipping %s: %s content is unchanged since the last sync.", profile_type, path)
+                return True, None, None
+            return True, content, marker
+
+        # Read the files concurrently so their stat/open/read latencies overlap
+        with ThreadPoolExecutor(max_workers=len(profile_files)) as executor:
+            loaded = list(executor.map(_load_profile, profile_files, profile_files.values()))
+
         profiles_content = {}
-        
-        with open(codeforces_file, 'r', encoding='utf-8') as f:
-            profiles_content['codeforces'] = f.read()
-        with open(leetcode_file, 'r', encoding='utf-8') as f:
-            profiles_content['leetcode'] = f.read()
-        with open(steam_file, 'r', encoding='utf-8') as f:
-            profiles_content['steam'] = f.read()
-        with open(youtube_file, 'r', encoding='utf-8') as f:
-            profiles_content['youtube'] = f.read()
-        with open(chesscom_file, 'r', encoding='utf-8') as f:
-            profiles_content['chesscom'] = f.read()
-            
-        return self.sync_all_profiles_to_gdocs(profiles_content)
\ No newline at end of file
+        pending_markers = {}
+        all_files_found = True
+        for (profile_type, path), (found, content, marker) in zip(profile_files.items(), loaded):
+            all_files_found = all_files_found and found
+            if content is not None:
+                profiles_content[profile_type] = content
+                pending_markers[profile_type] = (path, marker)
+
+        results = self._sync_profiles(profiles_content)
+        for profile_type, succeeded in results.items():
+            if succeeded:
+                _write_sync_marker(*pending_markers[profile_type])
+
+        return all_files_found and all(results.values())
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""
+A small on-disk cache for API responses, one pickle file per entry.
+"""
+import os
+import time
+import pickle
+import hashlib
+import threading
+from scripts.config import CACHE_DIR
+
+
+class DiskCache:
+    """Caches picklable values under CACHE_DIR/<namespace>, expiring them by file age."""
+
+    def __init__(self, namespace):
+        self.directory = os.path.join(CACHE_DIR, namespace)
+
+    def _path(self, key):
+        digest = hashlib.sha1(repr(key).encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, f"{digest}.pkl")
+
+    def get(self, key, ttl=None):
+        """Returns the cached value for key, or None if it is missing or older than ttl seconds."""
+        path = self._path(key)
+        try:
+            if ttl is not None and time.time() - os.path.getmtime(path) >= ttl:
+                return None
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+            return None
+
+    def set(self, key, value):
+        """Stores value for key. Failures to write are ignored; the cache is only an optimization."""
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except (OSError, pickle.PicklingError, TypeError):
+            # prune() only looks at .pkl files, so a partial temp file would otherwise stay forever
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def prune(self, max_bytes):
+        """Deletes the least recently written entries until the namespace holds at most max_bytes."""
+        try:
+            entries = [entry for entry in os.scandir(self.directory) if entry.name.endswith('.pkl')]
+        except OSError:
+            return
+        files = []
+        for entry in entries:
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
@@ -3,12 +3,18 @@
 Handles Google API Authentication using OAuth 2.0.
 """
 import os
+import json
+import threading
+from datetime import datetime
 from scripts.config import (
     TOKEN_FILE, SCOPES,
     GOOGLE_PROJECT_ID, GOOGLE_AUTH_URI, GOOGLE_TOKEN_URI, GOOGLE_AUTH_PROVIDER_X509_CERT_URL,
     GOOGLE_CLIENT_ID, GOOGLE_CLIENT_SECRET, GOOGLE_REDIRECT_URIS,
-    GOOGLE_AUTH_URL_FILE, GOOGLE_SERVICE_ACCOUNT_KEY_PATH
+    GOOGLE_AUTH_URL_FILE, GOOGLE_SERVICE_ACCOUNT_KEY_PATH, GOOGLE_TOKEN_CACHE_FILE
 )
+from scripts.modules.cloud_sync import _write_json_atomic
+
+__all__ = ["GoogleAuthenticator", "GOOGLE_LIBS_AVAILABLE", "get_authenticator"]
 
 try:
     from google.auth.transport.requests import Request
@@ -16,17 +22,44 @@ try:
     from google_auth_oauthlib.flow import InstalledAppFlow
     from googleapiclient.discovery import build
     from google.oauth2 import service_account
+    from googleapiclient.model import JsonModel
+    import google_auth_httplib2
+    import httplib2
     GOOGLE_LIBS_AVAILABLE = True
 except ImportError:
     GOOGLE_LIBS_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+if GOOGLE_LIBS_AVAILABLE:
+    class OrjsonJsonModel(JsonModel):
+        """JsonModel that serializes request bodies with orjson when it is installed."""
+
+        def serialize(self, body_value):
+            if ORJSON_AVAILABLE:
+                if isinstance(body_value, dict) and "data" not in body_value and self._data_wrapper:
+                    body_value = {"data": body_value}
+                serialized = orjson.dumps(body_value)
+                # orjson emits raw UTF-8, but request bodies must stay ASCII-escaped str like
+                # json.dumps produces, so anything else goes through the stdlib encoder.
+                if serialized.isascii():
+                    return serialized.decode("ascii")
+            return super().serialize(body_value)
+
 class GoogleAuthenticator:
     """A class to handle Google API authentication."""
 
     def __init__(self):
         if not GOOGLE_LIBS_AVAILABLE:
             raise ImportError("Google client libraries not installed.")
+        self._user_creds = None
         self.creds = self._authenticate_service_account()
+        self._services = {}
 
     def _authenticate_service_account(self):
         """Authenticates using a service account and returns credentials."""
@@ -34,14 +67,47 @@ class GoogleAuthenticator:
             try:
                 creds = service_account.Credentials.from_service_account_file(
                     GOOGLE_SERVICE_ACCOUNT_KEY_PATH, scopes=SCOPES)
+                self._load_cached_token(creds)
+                if not creds.valid:
+                    creds.refresh(Request())
+                    self._save_cached_token(creds)
                 print("Authenticated using Service Account.")
                 return creds
             except Exception as e:
                 print(f"Service Account authentication failed: {e}")
         return None
 
+    @staticmethod
+    def _token_cache_key(creds):
+        return {"account": creds.service_account_email, "scopes": sorted(SCOPES)}
+
+    def _load_cached_token(self, creds):
+        """Restores the service account's access token from the previous run, if it is for the same account and scopes."""
+        try:
+            with open(GOOGLE_TOKEN_CACHE_FILE, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+            if {k: cached.get(k) for k in ("account", "scopes")} != self._token_cache_key(creds):
+                return
+            creds.token = cached["token"]
+            creds.expiry = datetime.fromisoformat(cached["expiry"])
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    def _save_cached_token(self, creds):
+        """Stores the service account's access token so the next run can skip the token exchange."""
+        if not creds.token or not creds.expiry:
+            return
+        # Written via a temporary file so a concurrent run never reads a half-written token
+        try:
+            _write_json_atomic(GOOGLE_TOKEN_CACHE_FILE, {**self._token_cache_key(creds), "token": creds.token,
+                                                         "expiry": creds.expiry.isoformat()})
+        except OSError as e:
+            print(f"WARNING: Could not cache Google access token: {e}")
+
     def _authenticate_user_oauth(self):
         """Authenticates using user-based OAuth 2.0 and returns credentials."""
+        if self._user_creds and self._user_creds.valid:
+            return self._user_creds
         creds = None
         if os.path.exists(TOKEN_FILE):
             creds = Credentials.from_authorized_user_file(TOKEN_FILE, SCOPES)
@@ -81,29 +147,68 @@ class GoogleAuthenticator:
             
             with open(TOKEN_FILE, "w") as token:
                 token.write(creds.to_json())
+        self._user_creds = creds
         return creds
 
     def get_service(self, service_name, version):
-        """Builds and returns an authorized API service object using service account credentials."""
+        """
+        Returns an authorized API service object using service account credentials.
+        Services are built once per authenticator from the discovery documents bundled with
+        googleapiclient, so no discovery request is made.
+        """
         if not self.creds:
             print("Service account authentication failed. Cannot create service.")
             return None
+        key = ("service_account", service_name, version)
+        if key in self._services:
+            return self._services[key]
         try:
-            service = build(service_name, version, credentials=self.creds)
+            service = build(service_name, version, credentials=self.creds, model=OrjsonJsonModel(),
+                            static_discovery=True)
+            self._services[key] = service
             return service
         except Exception as e:
             print(f"Failed to create service {service_name} v{version} with service account: {e}")
             return None
 
+    def authorized_http(self):
+        """
+        Returns a new authorized HTTP client for the service account credentials.
+        httplib2 clients are not thread-safe, so each worker thread needs its own.
+        """
+        return google_auth_httplib2.AuthorizedHttp(self.creds, http=httplib2.Http())
+
     def get_user_service(self, service_name, version):
-        """Builds and returns an authorized API service object using user-based OAuth credentials."""
+        """Returns an authorized API service object using user-based OAuth credentials, built once per authenticator."""
+        key = ("user", service_name, version)
+        if key in self._services:
+            return self._services[key]
         user_creds = self._authenticate_user_oauth()
         if not user_creds:
             print("User OAuth authentication failed. Cannot create service.")
             return None
         try:
-            service = build(service_name, version, credentials=user_creds)
+            service = build(service_name, version, credentials=user_creds, model=OrjsonJsonModel(),
+                            static_discovery=True)
+            self._services[key] = service
             return service
         except Exception as e:
             print(f"Failed to create service {service_name} v{version} with user OAuth: {e}")
-            return None
\ No newline at end of file
+            return None
+
+
+_AUTHENTICATOR = None
+_AUTHENTICATOR_LOCK = threading.Lock()
+
+
+def get_authenticator():
+    """
+    Returns the GoogleAuthenticator shared by the whole process, so the service account key
+    is loaded and the services are built only once however many callers need them. The lock
+    keeps threads that ask at the same moment from each authenticating on their own.
+    """
+    global _AUTHENTICATOR
+    with _AUTHENTICATOR_LOCK:
+        if _AUTHENTICATOR is None:
+            _AUTHENTICATOR = GoogleAuthenticator()
+        return _AUTHENTICATOR
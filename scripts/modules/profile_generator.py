@@ -2,35 +2,201 @@
 """
 Generates profiles for various competitive programming and gaming platforms.
 """
+import io
 import requests
+from requests.adapters import HTTPAdapter
 import time
 import json
 from datetime import datetime
 from collections import Counter
+from functools import lru_cache, partial
+from operator import itemgetter
 import hashlib
 import random
-import string
-from typing import Dict, Any
+import secrets
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+from typing import Dict, Any, Tuple
 from scripts.config import (
     CF_HANDLE, LEETCODE_USERNAME,
     LEETCODE_API_ENDPOINT, STEAM_ID, STEAM_API_KEY, STEAM_API_ENDPOINT, YOUTUBE_CHANNEL_ID,
     CF_API_KEY, CF_API_SECRET, CODEFORCES_API_ENDPOINT,
     CHESSCOM_ID, CHESSCOM_API_ENDPOINT
 )
-from scripts.modules.google_auth import GoogleAuthenticator
-from googleapiclient.errors import HttpError
+from scripts.modules.disk_cache import DiskCache
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# API payloads such as Codeforces user.status can run to megabytes, so decode with orjson when installed.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so error handling is the same either way.
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+# Concurrent per-contest fetches; the rate limiter still spaces the requests themselves
+MAX_CONCURRENT_FETCHES = 5
+
+# Retry policy for rate-limited (429) and server-error responses and dropped connections
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+MAX_RETRIES = 3
+MAX_BACKOFF_SECONDS = 60
+# Upper bound on requests in flight to any one host
+MAX_REQUESTS_PER_HOST = 16
+
+
+class _RateLimiter:
+    """Spaces out request starts by a minimum interval, shared by every thread using it."""
+
+    def __init__(self, interval):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_start = 0.0
+
+    def wait(self):
+        """Blocks until the caller may start its request."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+_HOST_SEMAPHORES = {}
+_HOST_SEMAPHORES_LOCK = threading.Lock()
+
+
+def _host_semaphore(url):
+    host = urlsplit(url).netloc
+    with _HOST_SEMAPHORES_LOCK:
+        if host not in _HOST_SEMAPHORES:
+            _HOST_SEMAPHORES[host] = threading.BoundedSemaphore(MAX_REQUESTS_PER_HOST)
+        return _HOST_SEMAPHORES[host]
+
+
+def _retry_after_seconds(response):
+    """Returns the delay a Retry-After header asks for, or None if it is absent or malformed."""
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
+    if value.isdigit():
+        return int(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _fmt_ts(timestamp, fmt='%Y-%m-%d %H:%M:%S'):
+    """Formats a Unix timestamp in local time without building a datetime object."""
+    return time.strftime(fmt, time.localtime(timestamp))
+
+
+# Memoized for the Chess.com stats, where best/highest/lowest dates often repeat
+@lru_cache(maxsize=512)
+def _fmt_ymd(timestamp):
+    return _fmt_ts(timestamp, '%Y-%m-%d')
+
+
+@lru_cache(maxsize=512)
+def _fmt_ymd_hms(timestamp):
+    return _fmt_ts(timestamp)
+
+
+def _make_session(pool_maxsize=10):
+    """
+    Returns a keep-alive session whose connection pool can serve pool_maxsize threads at once.
+    Retries are left to _request, so the adapter itself never retries.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def _request(method, url, rate_limiter=None, session=None, **kwargs):
+    """
+    Sends an HTTP request, retrying 429/5xx responses and connection errors with capped,
+    jittered exponential backoff. A Retry-After header from the server takes precedence.
+    The final response is returned as-is; connection errors on the last attempt are raised.
+    Requests go through session when one is given, to reuse its pooled connections.
+    """
+    send = session.request if session is not None else requests.request
+    for attempt in range(MAX_RETRIES + 1):
+        if rate_limiter:
+            rate_limiter.wait()
+        try:
+            with _host_semaphore(url):
+                response = send(method, url, **kwargs)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            if attempt == MAX_RETRIES:
+                raise
+            delay = None
+        else:
+            if response.status_code not in RETRY_STATUS_CODES or attempt == MAX_RETRIES:
+                return response
+            delay = _retry_after_seconds(response)
+        if delay is None:
+            delay = 2 ** attempt + random.random()
+        time.sleep(min(delay, MAX_BACKOFF_SECONDS))
+
+
+class _ProfileBuffer:
+    """
+    Collects profile lines in a StringIO instead of a list that is joined at the end.
+    getvalue() returns exactly what '\n'.join() over the appended lines would.
+    """
+
+    def __init__(self):
+        self._out = io.StringIO()
+        self._started = False
+
+    def append(self, line):
+        # One write per line, so lines appended from worker threads never interleave
+        if self._started:
+            self._out.write('\n' + line)
+        else:
+            self._started = True
+            self._out.write(line)
+
+    def extend(self, lines):
+        """Appends several lines with a single write."""
+        lines = list(lines)
+        if lines:
+            self.append('\n'.join(lines))
+
+    def getvalue(self):
+        return self._out.getvalue()
 
 
 class CodeforcesGenerator:
     """Generates a Codeforces profile."""
 
+    _rate_limiter = _RateLimiter(1)
+    # Seconds a successful response stays cached, per API method; other methods are always fetched
+    _CACHE_TTLS = {
+        'user.info': 600,
+        'user.status': 3600,
+        'user.ratedList': 3600,
+        'contest.hacks': 86400,  # Hacks of finished contests never change
+    }
+    # Methods whose failures are expected (user.friends fails without auth) and left out of the profile
+    _SILENT_METHODS = frozenset({'user.friends'})
+
     def __init__(self, handle=CF_HANDLE, api_key=CF_API_KEY, api_secret=CF_API_SECRET):
         self.handle = handle
         self.api_key = api_key
         self.api_secret = api_secret
-        self.profile_content = []
+        self.profile_content = _ProfileBuffer()
         self.base_url = CODEFORCES_API_ENDPOINT
         self.section_counter = 1
+        self.cache = DiskCache('codeforces')
+        self.session = _make_session(pool_maxsize=MAX_CONCURRENT_FETCHES)
 
     def _add_section_header(self, title):
         """Adds a formatted and numbered section header."""
@@ -40,20 +206,32 @@ class CodeforcesGenerator:
 
     def _generate_api_sig(self, method_name, params):
         """Generates the apiSig parameter for authorized methods."""
-        rand_prefix = ''.join(random.choices(string.ascii_lowercase + string.digits, k=6))
-        
-        # Parameters must be sorted alphabetically by key
-        sorted_params = sorted(params.items())
-        param_str = '&'.join([f'{k}={v}' for k, v in sorted_params])
-        
-        hash_str = f"{rand_prefix}/{method_name}?{param_str}#{self.api_secret}"
-        
+        rand_prefix = secrets.token_hex(3)
+
+        # The signed string is "<rand>/<method>?<params sorted by key>#<secret>", fed to the hash piecewise
         hasher = hashlib.sha512()
-        hasher.update(hash_str.encode('utf-8'))
-        
+        hasher.update(f"{rand_prefix}/{method_name}?".encode('utf-8'))
+        for i, (k, v) in enumerate(sorted(params.items())):
+            if i:
+                hasher.update(b'&')
+            hasher.update(f'{k}={v}'.encode('utf-8'))
+        hasher.update(f"#{self.api_secret}".encode('utf-8'))
+
         return rand_prefix + hasher.hexdigest()
 
-    def _fetch_data(self, method, params=None, authorized=False):
+    def _record_error(self, method, message, errors=None):
+        """
+        Adds an API error to the profile unless the method is expected to fail. Callers on worker
+        threads pass an errors list instead, and add its messages to the profile in their own order.
+        """
+        if method in self._SILENT_METHODS:
+            return
+        if errors is not None:
+            errors.append(message)
+        else:
+            self.profile_content.append(message)
+
+    def _fetch_data(self, method, params=None, authorized=False, errors=None):
         if params is None:
             params = {}
             
@@ -67,21 +245,27 @@ class CodeforcesGenerator:
             params['time'] = int(time.time())
             params['apiSig'] = self._generate_api_sig(method, params)
 
+        ttl = None if authorized else self._CACHE_TTLS.get(method)
+        cache_key = (method, sorted(params.items()))
+        if ttl:
+            cached = self.cache.get(cache_key, ttl)
+            if cached is not None:
+                return cached
+
         try:
-            response = requests.get(url, params=params, timeout=15)
-            time.sleep(1)  # Respect API rate limits
+            response = _request('GET', url, rate_limiter=self._rate_limiter, session=self.session,
+                                params=params, timeout=15)
             response.raise_for_status()
-            data = response.json()
+            data = _json_loads(response.content)
             if data.get('status') == 'OK':
+                if ttl:
+                    self.cache.set(cache_key, data.get('result'))
                 return data.get('result')
             else:
-                # Don't append error for user.friends as it's expected to fail without auth
-                if method != 'user.friends':
-                    self.profile_content.append(f"API Error for {method}: {data.get('comment', 'Unknown error')}")
+                self._record_error(method, f"API Error for {method}: {data.get('comment', 'Unknown error')}", errors)
                 return None
-        except requests.exceptions.RequestException as e:
-            if method != 'user.friends':
-                self.profile_content.append(f"An error occurred fetching data from {method}: {e}")
+        except (requests.exceptions.RequestException, ValueError) as e:
+            self._record_error(method, f"An error occurred fetching data from {method}: {e}", errors)
             return None
 
     def generate(self):
@@ -103,26 +287,47 @@ class CodeforcesGenerator:
             self.profile_content.append(f"- **Rating:** {user.get('rating', 'N/A')} ({user.get('rank', 'N/A')})")
             self.profile_content.append(f"- **Max Rating:** {user.get('maxRating', 'N/A')} ({user.get('maxRank', 'N/A')})")
             self.profile_content.append(f"- **Contribution:** {user.get('contribution', 'N/A')}")
-            self.profile_content.append(f"- **Registered:** {datetime.fromtimestamp(user.get('registrationTimeSeconds', 0)).strftime('%Y-%m-%d')}")
+            self.profile_content.append(f"- **Registered:** {_fmt_ts(user.get('registrationTimeSeconds', 0), '%Y-%m-%d')}")
             
             # Global Rank
             rated_list = self._fetch_data("user.ratedList", params={"activeOnly": "true"})
             if rated_list:
                 try:
-                    rank = next((i for i, u in enumerate(rated_list) if u['handle'] == self.handle), -1)
-                    if rank != -1:
-                        self.profile_content.append(f"- **Global Rank (Active):** {rank + 1} / {len(rated_list)}")
-                except (StopIteration, KeyError):
+                    # list.index scans the handles in C; only one lookup is needed, so no dict is built
+                    rank = list(map(itemgetter('handle'), rated_list)).index(self.handle)
+                    self.profile_content.append(f"- **Global Rank (Active):** {rank + 1} / {len(rated_list)}")
+                except (ValueError, KeyError):
                     pass # User not in active rated list
 
         # 2. Submissions Analysis (All submissions)
         all_submissions = self._fetch_data("user.status", params={"handle": self.handle})
         if all_submissions:
             self._add_section_header("Submissions Analysis (All Time)")
-            verdicts = Counter(s['verdict'] for s in all_submissions)
-            languages = Counter(s['programmingLanguage'] for s in all_submissions)
-            tags = Counter(tag for s in all_submissions if 'problem' in s for tag in s['problem'].get('tags', []))
-            
+            # Sorted once, newest first: that is the order the API already returns, so the sort is
+            # close to free and the counters see submissions in the same order as before. Every
+            # per-problem list below then comes out newest first and only needs reversing.
+            all_submissions.sort(key=itemgetter('creationTimeSeconds'), reverse=True)
+
+            # One pass collects the counters and the per-problem grouping used in section 5
+            verdicts, languages, tags = Counter(), Counter(), Counter()
+            submissions_by_problem = {}
+            for submission in all_submissions:
+                verdicts[submission['verdict']] += 1
+                languages[submission['programmingLanguage']] += 1
+                problem = submission.get('problem') or {}
+                problem_tags = problem.get('tags', [])
+                for tag in problem_tags:
+                    tags[tag] += 1
+                problem_key = (problem.get('contestId', ''), problem.get('index', ''))
+                problem_data = submissions_by_problem.get(problem_key)
+                if problem_data is None:
+                    problem_data = submissions_by_problem[problem_key] = {
+                        "name": problem.get('name', 'N/A'),
+                        "tags": problem_tags,
+                        "submissions": []
+                    }
+                problem_data['submissions'].append(submission)
+
             self.profile_content.append("### Verdicts:")
             for verdict, count in verdicts.most_common():
                 self.profile_content.append(f"- **{verdict}:** {count}")
@@ -140,7 +345,15 @@ class CodeforcesGenerator:
         if rating_history:
             self._add_section_header("Recent Contest Performance")
             recent_contests = sorted(rating_history, key=lambda x: x['ratingUpdateTimeSeconds'], reverse=True)[:5]
-            for contest in recent_contests:
+            # Fetch every contest's hacks up front so their request latencies overlap. Errors are
+            # collected per contest and written below, where the serial fetch used to write them.
+            def _fetch_hacks(contest):
+                errors = []
+                return self._fetch_data("contest.hacks", params={"contestId": contest['contestId']}, errors=errors), errors
+
+            with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_FETCHES) as executor:
+                hacks_by_contest = list(executor.map(_fetch_hacks, recent_contests))
+            for contest, (hacks, errors) in zip(recent_contests, hacks_by_contest):
                 contest_id = contest['contestId']
                 self.profile_content.append(f"- **Contest:** {contest['contestName']} (ID: {contest_id})")
                 self.profile_content.append(f"  - **Rank:** {contest['rank']}")
@@ -148,7 +361,8 @@ class CodeforcesGenerator:
                 self.profile_content.append(f"  - **New Rating:** {contest['newRating']}")
                 
                 # Hacks in this contest
-                hacks = self._fetch_data("contest.hacks", params={"contestId": contest_id})
+                for message in errors:
+                    self.profile_content.append(message)
                 if hacks:
                     user_hacks = [h for h in hacks if h['hacker']['members'][0]['handle'] == self.handle]
                     if user_hacks:
@@ -166,62 +380,54 @@ class CodeforcesGenerator:
 
         # 5. Problem Submission History
         if all_submissions:
-            submissions_by_problem = {}
-            for submission in all_submissions:
-                problem = submission['problem']
-                problem_key = f"{problem.get('contestId', '')}-{problem.get('index', '')}"
-                if problem_key not in submissions_by_problem:
-                    submissions_by_problem[problem_key] = {
-                        "name": problem.get('name', 'N/A'),
-                        "tags": problem.get('tags', []),
-                        "submissions": []
-                    }
-                submissions_by_problem[problem_key]['submissions'].append(submission)
-
             if submissions_by_problem:
                 self._add_section_header("Problem Submission History")
 
-                # Sort problems by contestId, then problem index if contestId is not None
-                def sort_key(item):
-                    contest_id_str = item[0].split('-')[0]
-                    problem_index = item[0].split('-')[1]
-                    contest_id = int(contest_id_str) if contest_id_str.isdigit() else float('inf')
-                    return (contest_id, problem_index)
-
-                sorted_problems = sorted(submissions_by_problem.items(), key=sort_key)
-
+                # Sort problems by contestId (problems without one last), then problem index. The
+                # sort keys are built once up front so the sort itself only compares tuples.
+                no_contest = float('inf')
+                sorted_problems = [
+                    ((contest_id if isinstance(contest_id, int) else no_contest, str(problem_index)), problem_data)
+                    for (contest_id, problem_index), problem_data in submissions_by_problem.items()
+                ]
+                sorted_problems.sort(key=itemgetter(0))
+
+                # This section dominates the profile, so each problem's lines are gathered locally
+                # and written to the buffer as one block
                 for _, problem_data in sorted_problems:
                     tags_str = ", ".join(problem_data['tags'])
-                    self.profile_content.append(f"### {problem_data['name']} (Tags: {tags_str})")
-                    
-                    # Sort submissions by time
-                    sorted_submissions = sorted(problem_data['submissions'], key=lambda s: s['creationTimeSeconds'])
+                    lines = [f"### {problem_data['name']} (Tags: {tags_str})"]
                     
-                    for sub in sorted_submissions:
-                        submission_time = datetime.fromtimestamp(sub.get('creationTimeSeconds', 0)).strftime('%Y-%m-%d %H:%M:%S')
-                        self.profile_content.append(f"- **Submission Time:** {submission_time}")
-                        self.profile_content.append(f"  - **Verdict:** {sub.get('verdict', 'N/A')}")
-                        self.profile_content.append(f"  - **Language:** {sub.get('programmingLanguage', 'N/A')}")
-                        self.profile_content.append(f"  - **Time:** {sub.get('timeConsumedMillis', 'N/A')} ms")
-                        self.profile_content.append(f"  - **Memory:** {sub.get('memoryConsumedBytes', 0) / 1024:.2f} KB")
-                    self.profile_content.append("") # Newline for spacing
+                    # Oldest submission first
+                    for sub in reversed(problem_data['submissions']):
+                        submission_time = _fmt_ts(sub.get('creationTimeSeconds', 0))
+                        lines.append(f"- **Submission Time:** {submission_time}")
+                        lines.append(f"  - **Verdict:** {sub.get('verdict', 'N/A')}")
+                        lines.append(f"  - **Language:** {sub.get('programmingLanguage', 'N/A')}")
+                        lines.append(f"  - **Time:** {sub.get('timeConsumedMillis', 'N/A')} ms")
+                        lines.append(f"  - **Memory:** {sub.get('memoryConsumedBytes', 0) / 1024:.2f} KB")
+                    lines.append("") # Newline for spacing
+                    self.profile_content.append('\n'.join(lines))
 
         print(f"Successfully generated exhaustive Codeforces profile for {self.handle}")
-        return '\n'.join(self.profile_content)
+        return self.profile_content.getvalue()
 
 class LeetCodeGenerator:
     """Generates a LeetCode profile."""
 
+    _rate_limiter = _RateLimiter(1)
+
     def __init__(self, username=LEETCODE_USERNAME):
         self.username = username
-        self.profile_content = []
+        self.profile_content = _ProfileBuffer()
+        self.session = _make_session()
 
     def _fetch_graphql_data(self, query, variables):
         try:
-            response = requests.post(LEETCODE_API_ENDPOINT, json={"query": query, "variables": variables}, timeout=15)
-            time.sleep(1)
+            response = _request('POST', LEETCODE_API_ENDPOINT, rate_limiter=self._rate_limiter, session=self.session,
+                                json={"query": query, "variables": variables}, timeout=15)
             response.raise_for_status()
-            return response.json().get('data')
+            return _json_loads(response.content).get('data')
         except requests.exceptions.RequestException as e:
             self.profile_content.append(f"An error occurred fetching data: {e}")
             return None
@@ -276,7 +482,7 @@ class LeetCodeGenerator:
 
             self.profile_content.append("## 3. Submission Calendar\n")
             try:
-                calendar_data = json.loads(user.get('submissionCalendar', '{}'))
+                calendar_data = _json_loads(user.get('submissionCalendar', '{}'))
                 total_active_days = sum(1 for count in calendar_data.values() if int(count) > 0)
                 self.profile_content.append(f"- **Total Active Days:** {total_active_days}")
                 # You can add more detailed calendar parsing here if needed
@@ -284,51 +490,84 @@ class LeetCodeGenerator:
                 self.profile_content.append("- Calendar data not available.")
 
         print(f"Successfully generated exhaustive LeetCode profile for {self.username}")
-        return '\n'.join(self.profile_content)
+        return self.profile_content.getvalue()
 
 class SteamStatsGenerator:
     """Generates a comprehensive Steam profile based on a detailed plan."""
 
+    _rate_limiter = _RateLimiter(0.5)
+    # Seconds a successful response stays cached
+    OWNED_GAMES_CACHE_TTL = 3600
+    ACHIEVEMENTS_CACHE_TTL = 3600
+    # Game schemas are the same for every user and rarely change
+    SCHEMA_CACHE_TTL = 30 * 24 * 3600
+    # Games whose achievements and stats are fetched at once; the rate limiter still spaces the requests
+    MAX_CONCURRENT_GAME_FETCHES = 16
+
     def __init__(self, api_key=STEAM_API_KEY, steam_id=STEAM_ID):
         self.api_key = api_key
         self.steam_id = steam_id
-        self.profile_content = []
+        self.profile_content = _ProfileBuffer()
         self.base_url = STEAM_API_ENDPOINT
+        self.cache = DiskCache('steam')
+        # One keep-alive session for every call, with a pool large enough for all game fetch workers
+        self.session = _make_session(pool_maxsize=self.MAX_CONCURRENT_GAME_FETCHES)
 
-    def _make_api_call(self, interface, method, version, params=None):
-        """Makes a call to the Steam Web API."""
+    def _make_api_call(self, interface, method, version, params=None, cache_ttl=None, per_user=True):
+        """
+        Makes a call to the Steam Web API, optionally serving it from the disk cache for cache_ttl seconds.
+        Calls made with per_user=False don't send the Steam ID, so their cache entries are shared by all users.
+        """
         if not self.api_key:
             self.profile_content.append("API Error: Steam API Key is missing.")
             return None
         
         url = f"{self.base_url}/{interface}/{method}/v{version}/"
         
-        base_params = {'key': self.api_key, 'steamid': self.steam_id, 'format': 'json'}
+        base_params = {'key': self.api_key, 'format': 'json'}
+        if per_user:
+            base_params['steamid'] = self.steam_id
         if params:
             base_params.update(params)
-            
+
+        # The API key doesn't affect the response, so it is left out of the cache key
+        cache_key = (interface, method, version, sorted((k, v) for k, v in base_params.items() if k != 'key'))
+        if cache_ttl:
+            cached = self.cache.get(cache_key, cache_ttl)
+            if cached is not None:
+                return cached
+
         try:
-            response = requests.get(url, params=base_params, timeout=30)
-            time.sleep(0.5) # Rate limiting
+            response = _request('GET', url, rate_limiter=self._rate_limiter, session=self.session,
+                                params=base_params, timeout=30)
             if response.status_code == 403:
                 return None
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException:
+            data = _json_loads(response.content)
+            if cache_ttl:
+                self.cache.set(cache_key, data)
+            return data
+        except (requests.exceptions.RequestException, ValueError):
             return None
 
     def _get_player_summaries(self):
         return self._make_api_call('ISteamUser', 'GetPlayerSummaries', 2, {'steamids': self.steam_id})
 
     def _get_owned_games(self):
-        return self._make_api_call('IPlayerService', 'GetOwnedGames', 1, {'include_appinfo': True, 'include_played_free_games': True})
+        return self._make_api_call('IPlayerService', 'GetOwnedGames', 1, {'include_appinfo': True, 'include_played_free_games': True},
+                                   cache_ttl=self.OWNED_GAMES_CACHE_TTL)
 
     def _get_player_achievements(self, app_id):
-        return self._make_api_call('ISteamUserStats', 'GetPlayerAchievements', 1, {'appid': app_id})
+        return self._make_api_call('ISteamUserStats', 'GetPlayerAchievements', 1, {'appid': app_id},
+                                   cache_ttl=self.ACHIEVEMENTS_CACHE_TTL)
 
     def _get_user_stats_for_game(self, app_id):
         return self._make_api_call('ISteamUserStats', 'GetUserStatsForGame', 2, {'appid': app_id})
 
+    def _get_schema_for_game(self, app_id):
+        return self._make_api_call('ISteamUserStats', 'GetSchemaForGame', 2, {'appid': app_id},
+                                   cache_ttl=self.SCHEMA_CACHE_TTL, per_user=False)
+
     def _get_player_level(self):
         return self._make_api_call('IPlayerService', 'GetSteamLevel', 1)
 
@@ -379,25 +618,41 @@ class SteamStatsGenerator:
         owned_games = self._get_owned_games()
         if owned_games and owned_games.get('response', {}).get('games'):
             games = sorted(owned_games['response']['games'], key=lambda x: x.get('playtime_forever', 0), reverse=True)
-            self.profile_content.append(f"**Total Games:** {owned_games['response'].get('game_count', len(games))}\n")
-
-            for game in games:
+            self.profile_content.append(f"**Total Games:** {owned_games['response'].get('game_count', len(games))}")
+            # Games never launched have nothing to report, so they are only counted
+            played = [game for game in games if game.get('playtime_forever', 0) > 0]
+            self.profile_content.append(f"**Never Played:** {len(games) - len(played)}\n")
+
+            # The per-game calls are independent, so fetch them concurrently and emit in playtime order.
+            # The cached schema says which games have achievements or stats at all, so the per-user
+            # calls are only made where they can return something.
+            def _fetch_game_data(game):
                 appid = game.get('appid')
+                schema = self._get_schema_for_game(appid)
+                if schema is None:
+                    return None, self._get_player_achievements(appid), self._get_user_stats_for_game(appid)
+                available = schema.get('game', {}).get('availableGameStats', {})
+                achievements = self._get_player_achievements(appid) if available.get('achievements') else None
+                user_stats = self._get_user_stats_for_game(appid) if available.get('stats') else None
+                return available, achievements, user_stats
+
+            with ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_GAME_FETCHES) as executor:
+                game_data = executor.map(_fetch_game_data, played)
+
+            for game, (available, achievements, user_stats) in zip(played, game_data):
                 playtime_hours = game.get('playtime_forever', 0) / 60
                 self.profile_content.append(f"### {game.get('name', 'Unknown Game')}")
                 self.profile_content.append(f"- **Playtime:** {playtime_hours:.2f} hours")
 
                 # Achievements
-                achievements = self._get_player_achievements(appid)
                 if achievements and achievements.get('playerstats', {}).get('success') and 'achievements' in achievements['playerstats']:
                     achieved = [a for a in achievements['playerstats']['achievements'] if a.get('achieved')]
-                    total = len(achievements['playerstats']['achievements'])
+                    total = len(available['achievements']) if available else len(achievements['playerstats']['achievements'])
                     self.profile_content.append(f"- **Achievements:** {len(achieved)} / {total}")
                 else:
                     self.profile_content.append("- **Achievements:** Game data could not be retrieved.")
 
                 # User Stats
-                user_stats = self._get_user_stats_for_game(appid)
                 if user_stats and user_stats.get('playerstats', {}).get('success') and 'stats' in user_stats['playerstats']:
                     self.profile_content.append("- **Game Stats:**")
                     for stat in user_stats['playerstats']['stats']:
@@ -408,25 +663,43 @@ class SteamStatsGenerator:
 
         # 3. Finalize
         print(f"Successfully generated Steam profile for Steam ID: {self.steam_id}")
-        return '\n'.join(self.profile_content)
+        return self.profile_content.getvalue()
 
 class YouTubeGenerator:
     """Generates a YouTube profile."""
 
+    # Seconds cached video statistics are reused
+    VIDEO_STATS_CACHE_TTL = 3600
+    # Playlists whose items are fetched at once
+    MAX_CONCURRENT_PLAYLIST_FETCHES = 8
+
     def __init__(self, channel_id=YOUTUBE_CHANNEL_ID):
         self.channel_id = channel_id
-        self.profile_content = []
-        self.youtube_service = GoogleAuthenticator().get_service('youtube', 'v3')
+        self.profile_content = _ProfileBuffer()
+        self.cache = DiskCache('youtube')
+        # Imported here so the other generators don't pay for loading the Google client libraries
+        from scripts.modules.google_auth import get_authenticator
+        self.authenticator = get_authenticator()
+        self.youtube_service = self.authenticator.get_service('youtube', 'v3')
+        self._thread_local = threading.local()
+
+    def _get_http(self):
+        """Returns the authorized HTTP client owned by the calling thread."""
+        http = getattr(self._thread_local, 'http', None)
+        if http is None:
+            http = self._thread_local.http = self.authenticator.authorized_http()
+        return http
 
     def _get_channel_stats(self):
         if not self.youtube_service:
             return None
+        from googleapiclient.errors import HttpError
         try:
             request = self.youtube_service.channels().list(
                 part="snippet,contentDetails,statistics",
                 id=self.channel_id
             )
-            response = request.execute()
+            response = request.execute(num_retries=MAX_RETRIES)
             return response.get('items', [{}])[0]
         except HttpError as err:
             print(f"YouTube API HttpError: {err.resp.status} - {err.content}")
@@ -445,7 +718,7 @@ class YouTubeGenerator:
             maxResults=50
         )
         while request:
-            response = request.execute()
+            response = request.execute(num_retries=MAX_RETRIES)
             playlists.extend(response.get('items', []))
             request = self.youtube_service.playlists().list_next(request, response)
         return playlists
@@ -460,20 +733,36 @@ class YouTubeGenerator:
             maxResults=50
         )
         while request and len(videos) < 500:
-            response = request.execute()
+            response = request.execute(http=self._get_http(), num_retries=MAX_RETRIES)
             videos.extend(response.get('items', []))
             request = self.youtube_service.playlistItems().list_next(request, response)
         return videos
 
-    def _get_video_stats(self, video_id):
+    def _get_video_stats_bulk(self, video_ids):
+        """
+        Returns {video_id: statistics}, fetching up to 50 videos per videos.list call.
+        Empty ids (deleted or private items) are skipped and repeated ids are fetched once.
+        """
         if not self.youtube_service:
-            return None
-        request = self.youtube_service.videos().list(
-            part="statistics",
-            id=video_id
-        )
-        response = request.execute()
-        return response.get('items', [{}])[0].get('statistics', {})
+            return {}
+        stats_by_id = {}
+        missing_ids = []
+        for video_id in dict.fromkeys(filter(None, video_ids)):
+            cached = self.cache.get(('videos.list', video_id), self.VIDEO_STATS_CACHE_TTL)
+            if cached is not None:
+                stats_by_id[video_id] = cached
+            else:
+                missing_ids.append(video_id)
+        for start in range(0, len(missing_ids), 50):
+            request = self.youtube_service.videos().list(
+                part="statistics",
+                id=",".join(missing_ids[start:start + 50])
+            )
+            response = request.execute(num_retries=MAX_RETRIES)
+            for item in response.get('items', []):
+                stats_by_id[item['id']] = item.get('statistics', {})
+                self.cache.set(('videos.list', item['id']), stats_by_id[item['id']])
+        return stats_by_id
 
     def _get_special_playlist(self, playlist_id, limit=500):
         if not self.youtube_service:
@@ -486,7 +775,7 @@ class YouTubeGenerator:
                 maxResults=50
             )
             while request and len(videos) < limit:
-                response = request.execute()
+                response = request.execute(http=self._get_http(), num_retries=MAX_RETRIES)
                 videos.extend(response.get('items', []))
                 request = self.youtube_service.playlistItems().list_next(request, response)
         except Exception as e:
@@ -504,7 +793,7 @@ class YouTubeGenerator:
             maxResults=50
         )
         while request:
-            response = request.execute()
+            response = request.execute(num_retries=MAX_RETRIES)
             subscriptions.extend(response.get('items', []))
             request = self.youtube_service.subscriptions().list_next(request, response)
         return subscriptions
@@ -534,22 +823,31 @@ class YouTubeGenerator:
         self.profile_content.append(f"- **Published At:** {snippet.get('publishedAt', 'N/A')}")
         self.profile_content.append("\n" + "="*40 + "\n")
 
+        # Every playlist, plus the liked videos and watch history, is paged through on its own thread
         playlists = self._get_playlists()
+        with ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_PLAYLIST_FETCHES) as executor:
+            liked_future = executor.submit(self._get_special_playlist, 'LL')
+            history_future = executor.submit(self._get_special_playlist, 'HL')
+            playlist_videos = list(zip(playlists, executor.map(self._get_playlist_videos, [playlist.get('id') for playlist in playlists])))
+
         if playlists:
             self.profile_content.append("## 2. Playlists\n")
-            for playlist in playlists:
+            # One statistics lookup for every distinct video across all playlists
+            video_stats_by_id = self._get_video_stats_bulk(
+                video.get('snippet', {}).get('resourceId', {}).get('videoId')
+                for _, videos in playlist_videos for video in videos)
+            for playlist, videos in playlist_videos:
                 playlist_snippet = playlist.get('snippet', {})
                 self.profile_content.append(f"### {playlist_snippet.get('title', 'N/A')}\n")
-                videos = self._get_playlist_videos(playlist.get('id'))
                 for video in videos:
                     video_snippet = video.get('snippet', {})
-                    video_stats = self._get_video_stats(video_snippet.get('resourceId', {}).get('videoId'))
+                    video_stats = video_stats_by_id.get(video_snippet.get('resourceId', {}).get('videoId'), {})
                     self.profile_content.append(f"- **{video_snippet.get('title', 'N/A')}**")
                     self.profile_content.append(f"  - Views: {video_stats.get('viewCount', 'N/A')}")
                     self.profile_content.append(f"  - Likes: {video_stats.get('likeCount', 'N/A')}")
                     self.profile_content.append(f"  - Comments: {video_stats.get('commentCount', 'N/A')}")
         
-        liked_videos = self._get_special_playlist('LL')
+        liked_videos = liked_future.result()
         if liked_videos:
             self.profile_content.append("\n## 3. Liked Videos (Last 500)\n")
             for item in liked_videos:
@@ -558,7 +856,7 @@ class YouTubeGenerator:
                 channel = snippet.get('videoOwnerChannelTitle', 'N/A')
                 self.profile_content.append(f"- **{title}** by {channel}")
 
-        watch_history = self._get_special_playlist('HL')
+        watch_history = history_future.result()
         if watch_history:
             self.profile_content.append("\n## 4. Watch History (Last 500 Videos)\n")
             for item in watch_history:
@@ -576,29 +874,96 @@ class YouTubeGenerator:
                 self.profile_content.append(f"- {title}")
 
         print(f"Successfully generated YouTube profile for channel {self.channel_id}")
-        return '\n'.join(self.profile_content)
+        return self.profile_content.getvalue()
 
 class ChessComGenerator:
     """Generates a Chess.com profile."""
 
+    # Monthly archives fetched at once, newest first; usually only the first few months are needed
+    MAX_CONCURRENT_ARCHIVE_FETCHES = 8
+    # Size the archive cache is trimmed back to after each run
+    ARCHIVE_CACHE_MAX_BYTES = 100 * 1024 * 1024
+    # Look-back bound: past this many months, the scan stops once either time class has
+    # MIN_GAMES_PER_CLASS games, trading a short list for the other class against scanning years of history
+    MAX_MONTHS_TO_SCAN = 12
+    MIN_GAMES_PER_CLASS = 50
+    # The only game fields the profile reads; the rest (fen, tcn, accuracies, players...) are dropped on arrival
+    GAME_FIELDS = ('pgn', 'time_class')
+
     def __init__(self, username: str = CHESSCOM_ID):
         self.username = username
-        self.profile_content = []
+        self.profile_content = _ProfileBuffer()
         self.base_url = CHESSCOM_API_ENDPOINT
+        self.session = _make_session(pool_maxsize=self.MAX_CONCURRENT_ARCHIVE_FETCHES)
+        # Accept-Encoding is left to requests, which already offers br whenever brotli is installed
+        self.session.headers['User-Agent'] = 'The-Automaton (+https://github.com/jaipkapoor99/The-Automaton)'
+        self.cache = DiskCache('chesscom')
 
-    def _fetch_data(self, endpoint: str) -> Dict[str, Any]:
+    def _fetch_data(self, endpoint: str, revalidate: bool = True, transform=None, errors=None) -> Dict[str, Any]:
+        """
+        Fetches an endpoint. With revalidate, the last body is kept with its ETag/Last-Modified and
+        the next request is made conditional, so an unchanged resource comes back as an empty 304.
+        transform, if given, is applied to the decoded body before it is cached or returned.
+        Callers on worker threads pass an errors list and add its messages to the profile themselves.
+        """
         url = f"{self.base_url}/{endpoint}"
-        headers = {
-            'User-Agent': 'The-Automaton'
-        }
+        headers = {}
+        cached = self.cache.get(('conditional', endpoint)) if revalidate else None
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
         try:
-            response = requests.get(url, headers=headers, timeout=15)
+            response = _request('GET', url, session=self.session, headers=headers, timeout=15)
+            if cached and response.status_code == 304:
+                return cached['body']
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            self.profile_content.append(f"An error occurred fetching data from {endpoint}: {e}")
+            data = _json_loads(response.content)
+            if transform:
+                data = transform(data)
+            if revalidate and (response.headers.get('ETag') or response.headers.get('Last-Modified')):
+                self.cache.set(('conditional', endpoint), {
+                    'etag': response.headers.get('ETag'),
+                    'last_modified': response.headers.get('Last-Modified'),
+                    'body': data,
+                })
+            return data
+        except (requests.exceptions.RequestException, ValueError) as e:
+            message = f"An error occurred fetching data from {endpoint}: {e}"
+            if errors is not None:
+                errors.append(message)
+            else:
+                self.profile_content.append(message)
             return {}
 
+    def _fetch_archive(self, endpoint: str, errors=None) -> Dict[str, Any]:
+        """
+        Fetches a monthly archive (endpoint ends in YYYY/MM). Archives of finished months never
+        change, so they are cached without expiry; only the current month is always fetched.
+        """
+        try:
+            year, month = (int(part) for part in endpoint.rsplit('/', 2)[-2:])
+        except ValueError:
+            return self._fetch_data(endpoint, transform=self._compact_archive, errors=errors)
+        now = time.gmtime()
+        if (year, month) >= (now.tm_year, now.tm_mon):
+            return self._fetch_data(endpoint, transform=self._compact_archive, errors=errors)
+        cached = self.cache.get(('archive', endpoint))
+        if cached is not None:
+            return cached
+        data = self._fetch_data(endpoint, revalidate=False, transform=self._compact_archive, errors=errors)
+        if data:
+            self.cache.set(('archive', endpoint), data)
+        return data
+
+    def _compact_archive(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Keeps only GAME_FIELDS of each game, so a month's full game dicts can be freed straight away."""
+        if not data:
+            return data
+        return {'games': [{field: game[field] for field in self.GAME_FIELDS if field in game}
+                          for game in data.get('games', [])]}
+
     def _add_header(self, text: str, level: int = 1):
         """Adds a formatted header to the profile content."""
         self.profile_content.append(f"\n{text}")
@@ -607,10 +972,9 @@ class ChessComGenerator:
         else:
             self.profile_content.append("-" * len(text))
 
-    def _format_game_entry(self, game: Dict[str, Any]) -> str:
-        """Formats a single game entry to return only the PGN with a header."""
-        pgn = game.get('pgn', 'PGN not available')
-        return f"--- PGN ---\n{pgn}\n--- End Game ---"
+    def _format_game_entry(self, game: Dict[str, Any]) -> Tuple[str, str, str]:
+        """Formats a single game entry as the lines of its PGN with a header and footer."""
+        return ('--- PGN ---', game.get('pgn', 'PGN not available'), '--- End Game ---')
 
     def generate(self) -> bool:
         """Fetches and generates the Chess.com profile."""
@@ -619,82 +983,113 @@ class ChessComGenerator:
             print("ERROR: Chess.com username not set.")
             return False
 
+        # Bound once; the game loops below append hundreds of lines
+        append = self.profile_content.append
+        extend = self.profile_content.extend
+
         title = f"Chess.com Profile: {self.username}"
-        self.profile_content.append(title)
-        self.profile_content.append("=" * len(title))
-        self.profile_content.append(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        append(title)
+        append("=" * len(title))
+        append(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
         # 1. Player Profile
-        profile_data = self._fetch_data(f"player/{self.username}")
-        stats_data = self._fetch_data(f"player/{self.username}/stats")
-        clubs_data = self._fetch_data(f"player/{self.username}/clubs")
-        archives_data = self._fetch_data(f"player/{self.username}/games/archives")
+        # The four endpoints are independent, so they are requested together
+        endpoints = [f"player/{self.username}", f"player/{self.username}/stats",
+                     f"player/{self.username}/clubs", f"player/{self.username}/games/archives"]
+        def _fetch(fetch, endpoint):
+            errors = []
+            return fetch(endpoint, errors=errors), errors
+
+        with ThreadPoolExecutor(max_workers=len(endpoints)) as executor:
+            results = list(executor.map(partial(_fetch, self._fetch_data), endpoints))
+        for _, errors in results:
+            extend(errors)
+        profile_data, stats_data, clubs_data, archives_data = (data for data, _ in results)
 
         if profile_data:
             self._add_header("1. Player Profile", 2)
-            self.profile_content.append(f"- Username: {profile_data.get('username', 'N/A')}")
-            self.profile_content.append(f"- Name: {profile_data.get('name', 'N/A')}")
-            self.profile_content.append(f"- Country: {profile_data.get('country', 'N/A').split('/')[-1]}")
-            self.profile_content.append(f"- Followers: {profile_data.get('followers', 'N/A')}")
+            append(f"- Username: {profile_data.get('username', 'N/A')}")
+            append(f"- Name: {profile_data.get('name', 'N/A')}")
+            append(f"- Country: {profile_data.get('country', 'N/A').split('/')[-1]}")
+            append(f"- Followers: {profile_data.get('followers', 'N/A')}")
             if 'last_online' in profile_data:
-                last_online = datetime.fromtimestamp(profile_data['last_online']).strftime('%Y-%m-%d %H:%M:%S')
-                self.profile_content.append(f"- Last Online: {last_online}")
+                last_online = _fmt_ymd_hms(profile_data['last_online'])
+                append(f"- Last Online: {last_online}")
 
         if stats_data:
             self._add_header("Detailed Stats", 2)
             for category, stats in stats_data.items():
                 if 'last' in stats and 'rating' in stats['last']:
-                    self.profile_content.append(f"- {category.replace('chess_', '').replace('_', ' ').title()}:")
-                    self.profile_content.append(f"  - Current Rating: {stats['last']['rating']}")
-                    self.profile_content.append(f"  - Best Rating: {stats['best']['rating']} ({datetime.fromtimestamp(stats['best']['date']).strftime('%Y-%m-%d')})")
-                    self.profile_content.append(f"  - Record: {stats['record']['win']}W / {stats['record']['loss']}L / {stats['record']['draw']}D")
+                    append(f"- {category.replace('chess_', '').replace('_', ' ').title()}:")
+                    append(f"  - Current Rating: {stats['last']['rating']}")
+                    append(f"  - Best Rating: {stats['best']['rating']} ({_fmt_ymd(stats['best']['date'])})")
+                    append(f"  - Record: {stats['record']['win']}W / {stats['record']['loss']}L / {stats['record']['draw']}D")
             
             if 'tactics' in stats_data:
                 tactics_stats = stats_data['tactics']
-                self.profile_content.append("- Tactics:")
+                append("- Tactics:")
                 if 'highest' in tactics_stats:
-                    self.profile_content.append(f"  - Highest Rating: {tactics_stats['highest']['rating']} ({datetime.fromtimestamp(tactics_stats['highest']['date']).strftime('%Y-%m-%d')})")
+                    append(f"  - Highest Rating: {tactics_stats['highest']['rating']} ({_fmt_ymd(tactics_stats['highest']['date'])})")
                 if 'lowest' in tactics_stats:
-                     self.profile_content.append(f"  - Lowest Rating: {tactics_stats['lowest']['rating']} ({datetime.fromtimestamp(tactics_stats['lowest']['date']).strftime('%Y-%m-%d')})")
+                     append(f"  - Lowest Rating: {tactics_stats['lowest']['rating']} ({_fmt_ymd(tactics_stats['lowest']['date'])})")
 
             if 'puzzle_rush' in stats_data and 'best' in stats_data['puzzle_rush']:
                 puzzle_rush_stats = stats_data['puzzle_rush']['best']
-                self.profile_content.append("- Puzzle Rush:")
-                self.profile_content.append(f"  - Best Score: {puzzle_rush_stats.get('score', 'N/A')}")
+                append("- Puzzle Rush:")
+                append(f"  - Best Score: {puzzle_rush_stats.get('score', 'N/A')}")
 
         # 2. Clubs
         if clubs_data and clubs_data.get('clubs'):
             self._add_header("2. Clubs", 2)
             for club in clubs_data['clubs']:
-                self.profile_content.append(f"- {club.get('name', 'N/A')}")
+                append(f"- {club.get('name', 'N/A')}")
 
         # 3. Recent Games from Archives
         if archives_data and archives_data.get('archives'):
             self._add_header("3. Recent Games from Archives", 2)
             rapid_games = []
             blitz_games = []
-            for archive_url in reversed(archives_data['archives']):
+            months_scanned = 0
+
+            def _enough():
                 if len(rapid_games) >= 100 and len(blitz_games) >= 100:
-                    break
-                games_data = self._fetch_data(archive_url.replace(self.base_url + '/', ''))
-                if games_data and games_data.get('games'):
-                    for game in reversed(games_data['games']):
-                        time_class = game.get('time_class')
-                        if time_class == 'rapid' and len(rapid_games) < 100:
-                            rapid_games.append(game)
-                        elif time_class == 'blitz' and len(blitz_games) < 100:
-                            blitz_games.append(game)
+                    return True
+                return months_scanned >= self.MAX_MONTHS_TO_SCAN and (
+                    len(rapid_games) >= self.MIN_GAMES_PER_CLASS or len(blitz_games) >= self.MIN_GAMES_PER_CLASS)
+
+            # Months are fetched a window at a time and consumed newest first, so games are picked
+            # in the same order as a serial scan and at most one window is fetched past the last month used
+            endpoints = [archive_url.replace(self.base_url + '/', '') for archive_url in reversed(archives_data['archives'])]
+            window = self.MAX_CONCURRENT_ARCHIVE_FETCHES
+            with ThreadPoolExecutor(max_workers=window) as executor:
+                for start in range(0, len(endpoints), window):
+                    if _enough():
+                        break
+                    for games_data, errors in executor.map(partial(_fetch, self._fetch_archive), endpoints[start:start + window]):
+                        if _enough():
+                            break
+                        # Errors of months fetched past the last one used are dropped with them
+                        extend(errors)
+                        months_scanned += 1
+                        if games_data and games_data.get('games'):
+                            for game in reversed(games_data['games']):
+                                time_class = game.get('time_class')
+                                if time_class == 'rapid' and len(rapid_games) < 100:
+                                    rapid_games.append(game)
+                                elif time_class == 'blitz' and len(blitz_games) < 100:
+                                    blitz_games.append(game)
+            self.cache.prune(self.ARCHIVE_CACHE_MAX_BYTES)
 
             if rapid_games:
                 self._add_header("Last 100 Rapid Games (PGN)", 3)
                 for game in rapid_games:
-                    self.profile_content.append(self._format_game_entry(game))
+                    extend(self._format_game_entry(game))
 
             if blitz_games:
                 self._add_header("Last 100 Blitz Games (PGN)", 3)
                 for game in blitz_games:
-                    self.profile_content.append(self._format_game_entry(game))
+                    extend(self._format_game_entry(game))
 
         print(f"Successfully generated Chess.com profile for {self.username}")
         print(f"Successfully generated Chess.com profile for {self.username}")
-        return '\n'.join(self.profile_content)
\ No newline at end of file
+        return self.profile_content.getvalue()
\ No newline at end of file
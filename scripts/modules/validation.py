@@ -3,9 +3,99 @@
 Handles validation tasks for The-Mind repository, such as checking file 
 references and linting Markdown files.
 """
+import os
 import subprocess
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import partial
+from importlib import metadata
 from pathlib import Path
 from scripts.config import ROOT_DIR, print_section_header
+from scripts.modules.disk_cache import DiskCache
+
+try:
+    from pymarkdown.api import PyMarkdownApi, PyMarkdownApiException
+    PYMARKDOWN_API_AVAILABLE = True
+except ImportError:
+    PYMARKDOWN_API_AVAILABLE = False
+
+# Directories never searched for Markdown files; .github was always excluded by the old '.git' substring filter
+SKIPPED_DIRS = frozenset({'.git', '.github', 'node_modules', '.venv', '__pycache__', 'dist', 'build'})
+# Files passed on one pymarkdown command line, keeping argv well below the OS limit
+MAX_FILES_PER_INVOCATION = 200
+# Files each worker process must get before the API is run in parallel; a spawned worker re-imports pymarkdown
+MIN_FILES_PER_WORKER_PROCESS = 50
+# Files pymarkdown reads its configuration from; editing one can change the lint results
+PYMARKDOWN_CONFIG_FILES = ('.pymarkdown', '.pymarkdown.json', '.pymarkdown.yaml', '.pymarkdown.yml', 'pyproject.toml')
+
+
+def _count_lines(text):
+    """Counts the lines in text without splitting it into a list."""
+    if not text:
+        return 0
+    return text.count('\n') + (0 if text.endswith('\n') else 1)
+
+
+def _pymarkdown_version():
+    """Returns the installed pymarkdown version, or None if it can't be determined."""
+    try:
+        return metadata.version('pymarkdownlnt')
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def _mtime_snapshot(paths):
+    """Returns {path: mtime_ns} for paths."""
+    return {path: os.stat(path).st_mtime_ns for path in paths}
+
+
+def _format_scan_failure(failure):
+    """Formats a scan failure exactly as the pymarkdown CLI prints it."""
+    extra = f" [{failure.extra_error_information}]" if failure.extra_error_information else ""
+    return (f"{failure.scan_file}:{failure.line_number}:{failure.column_number}: "
+            f"{failure.rule_id}: {failure.rule_description}{extra} ({failure.rule_name})")
+
+
+def _run_pymarkdown_api_chunk(operation, md_files):
+    """
+    Runs a pymarkdown scan or fix over md_files through the in-process API, returning a
+    CompletedProcess shaped like the CLI's. Module-level so it can run in a worker process.
+    """
+    md_api = PyMarkdownApi()
+    output = []
+    try:
+        for md_file in md_files:
+            if operation == 'scan':
+                output.extend(_format_scan_failure(failure) + "\n" for failure in md_api.scan_path(md_file).scan_failures)
+            else:
+                output.extend(f"Fixed: {fixed_file}\n" for fixed_file in md_api.fix_path(md_file).files_fixed)
+    except PyMarkdownApiException as e:
+        return subprocess.CompletedProcess(['pymarkdown', operation], 1, stdout=''.join(output), stderr=str(e))
+    returncode = 1 if operation == 'scan' and output else 0
+    return subprocess.CompletedProcess(['pymarkdown', operation], returncode, stdout=''.join(output), stderr='')
+
+
+def _run_pymarkdown_cli_chunk(operation, md_files):
+    """Runs 'pymarkdown <operation>' over md_files as a subprocess."""
+    return subprocess.run(['pymarkdown', operation] + md_files, capture_output=True, text=True, check=False)
+
+
+def _pymarkdown_executor(file_count):
+    """
+    Returns (executor, workers) for running pymarkdown over file_count files. The API parses in Python,
+    so it needs processes for parallelism, and those only pay off with MIN_FILES_PER_WORKER_PROCESS files
+    each; below that the executor is None and the API runs serially in this process. The CLI only needs
+    threads to wait on its subprocesses.
+    """
+    cpu_count = os.cpu_count() or 1
+    if PYMARKDOWN_API_AVAILABLE:
+        workers = min(cpu_count, file_count // MIN_FILES_PER_WORKER_PROCESS)
+        if workers < 2:
+            return None, 1
+        return ProcessPoolExecutor(max_workers=workers), workers
+    workers = min(cpu_count, file_count)
+    return ThreadPoolExecutor(max_workers=workers), workers
+
 
 class Validator:
     """A class to handle validation tasks."""
@@ -13,68 +103,104 @@ class Validator:
     def __init__(self, root_dir=ROOT_DIR):
         """Initializes the Validator."""
         self.root_dir = Path(root_dir)
+        self.cache = DiskCache('validation')
+
+    def _run_pymarkdown(self, operation, md_files, executor, workers):
+        """
+        Runs pymarkdown <operation> over md_files on an executor from _pymarkdown_executor, split into
+        contiguous chunks (one per worker, at most MAX_FILES_PER_INVOCATION files each). Chunks run through
+        the API in worker processes when it is importable, otherwise as CLI subprocesses; with no executor
+        the API runs over all the files in this process.
+        Returns a CompletedProcess with the output concatenated in file order and the highest return code.
+        """
+        if executor is None:
+            return _run_pymarkdown_api_chunk(operation, md_files)
+
+        chunk_size = min(-(-len(md_files) // workers), MAX_FILES_PER_INVOCATION)
+        chunks = [md_files[i:i + chunk_size] for i in range(0, len(md_files), chunk_size)]
+        run_chunk = _run_pymarkdown_api_chunk if PYMARKDOWN_API_AVAILABLE else _run_pymarkdown_cli_chunk
+        results = list(executor.map(partial(run_chunk, operation), chunks))
+        return subprocess.CompletedProcess(
+            ['pymarkdown', operation] + md_files,
+            max(result.returncode for result in results),
+            stdout=''.join(result.stdout for result in results),
+            stderr=''.join(result.stderr for result in results),
+        )
+
+    def _lint_snapshot(self, md_files):
+        """
+        Returns {path: mtime_ns} for md_files plus any pymarkdown configuration file in the root
+        directory or the working directory, so a config edit invalidates a recorded clean run.
+        """
+        config_files = {os.path.join(directory, name)
+                        for directory in (str(self.root_dir), os.getcwd())
+                        for name in PYMARKDOWN_CONFIG_FILES}
+        return _mtime_snapshot(md_files + sorted(path for path in config_files if os.path.isfile(path)))
 
     def lint_markdown_files(self):
         """
-        Lints and fixes all Markdown files, reporting the number of fixes and remaining issues.
+        Fixes and then lints all Markdown files, reporting the files fixed and the remaining issues.
         """
         print_section_header("Markdown Linting")
         try:
-            md_files = [str(p) for p in self.root_dir.rglob('*.md') if ".git" not in str(p) and "node_modules" not in str(p)]
+            # Skipped directories are pruned before descending, so their contents are never listed
+            md_files = []
+            for dirpath, dirnames, filenames in os.walk(self.root_dir):
+                dirnames[:] = [d for d in dirnames if d not in SKIPPED_DIRS]
+                md_files.extend(os.path.join(dirpath, f) for f in filenames if f.endswith('.md'))
 
             if not md_files:
                 print("No Markdown files found to lint.")
                 return True
                 
             print(f"Found {len(md_files)} Markdown files to lint and fix.")
-            
-            # Initial scan to count issues
-            scan_command = ['pymarkdown', 'scan'] + md_files
-            scan_result = subprocess.run(scan_command, capture_output=True, text=True, check=False)
-            
-            initial_issues = scan_result.stdout.strip()
-            initial_issue_count = len(initial_issues.splitlines()) if initial_issues else 0
-
-            if scan_result.returncode != 0 and "command not found" in scan_result.stderr.lower():
-                 print("[ERROR] 'pymarkdown' command not found.")
-                 print("Please ensure it is installed and in your PATH: pip install pymarkdown-linter")
-                 return False
-
-            if initial_issue_count > 0:
-                print(f"[INFO] Found {initial_issue_count} initial markdown issues.")
-                print("----- Initial Issues -----")
-                print(initial_issues)
-                print("--------------------------")
-
-            # Attempt to fix the issues
-            print("\n[INFO] Attempting to automatically fix issues...")
-            fix_command = ['pymarkdown', 'fix'] + md_files
-            fix_result = subprocess.run(fix_command, capture_output=True, text=True, check=False)
-            
-            if fix_result.returncode != 0:
-                print("[WARNING] The 'pymarkdown fix' command encountered an error.")
-                print(fix_result.stderr)
 
-            # Rescan to see what issues remain
-            print("\n[INFO] Re-scanning files after fix attempt...")
-            rescan_result = subprocess.run(scan_command, capture_output=True, text=True, check=False)
-            
-            remaining_issues = rescan_result.stdout.strip()
-            remaining_issue_count = len(remaining_issues.splitlines()) if remaining_issues else 0
-            fixed_count = initial_issue_count - remaining_issue_count
-            
-            if fixed_count > 0:
-                print(f"[SUCCESS] Automatically fixed {fixed_count} markdown issue(s).")
-            
-            if remaining_issue_count > 0:
-                print(f"\n[WARNING] {remaining_issue_count} markdown issues remain:")
-                print("----- Remaining Issues -----")
-                print(remaining_issues)
-                print("----------------------------")
-                return False
-            else:
-                print("\n[SUCCESS] All Markdown files are valid.")
+            # A clean run records every file's mtime; if none has changed (and pymarkdown hasn't been
+            # upgraded) since then, the files are known to be clean without parsing them again
+            snapshot_key = ('md_lint_snapshot', str(self.root_dir), _pymarkdown_version())
+            if self.cache.get(snapshot_key) == self._lint_snapshot(md_files):
+                print("[INFO] No markdown files changed since last successful lint.")
                 return True
+            
+            # One pool serves both passes, so worker processes are only started (and import pymarkdown) once
+            executor, workers = _pymarkdown_executor(len(md_files))
+            with executor or nullcontext():
+                # Fix first and scan once afterwards; a scan before the fix would parse every file an extra time
+                print("[INFO] Attempting to automatically fix issues...")
+                fix_result = self._run_pymarkdown('fix', md_files, executor, workers)
+
+                if fix_result.returncode != 0 and "command not found" in fix_result.stderr.lower():
+                     print("[ERROR] 'pymarkdown' command not found.")
+                     print("Please ensure it is installed and in your PATH: pip install pymarkdown-linter")
+                     return False
+
+                if fix_result.returncode != 0:
+                    print("[WARNING] The 'pymarkdown fix' command encountered an error.")
+                    print(fix_result.stderr)
+
+                # pymarkdown fix reports one "Fixed: <path>" line per file it changed
+                fixed_file_count = sum(1 for line in fix_result.stdout.splitlines() if line.startswith("Fixed:"))
+                if fixed_file_count > 0:
+                    print(f"[SUCCESS] Automatically fixed markdown issues in {fixed_file_count} file(s).")
+
+                # Scan to see what issues remain
+                print("\n[INFO] Scanning files after fix attempt...")
+                scan_result = self._run_pymarkdown('scan', md_files, executor, workers)
+
+                remaining_issues = scan_result.stdout.strip()
+                remaining_issue_count = _count_lines(remaining_issues)
+
+                if remaining_issue_count > 0:
+                    print(f"\n[WARNING] {remaining_issue_count} markdown issues remain:")
+                    print("----- Remaining Issues -----")
+                    print(remaining_issues)
+                    print("----------------------------")
+                    return False
+                else:
+                    print("\n[SUCCESS] All Markdown files are valid.")
+                    # Taken after the fix pass, which may have rewritten files
+                    self.cache.set(snapshot_key, self._lint_snapshot(md_files))
+                    return True
                 
         except FileNotFoundError:
             print("[ERROR] 'pymarkdown' command not found.")